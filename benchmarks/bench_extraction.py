@@ -0,0 +1,128 @@
+"""End-to-end extraction benchmark against the local mock of the platform.
+
+Runs `ExtractionPipeline` (fetch + transform, with a no-op writer) over the
+mock server at several fetch concurrency levels and reports throughput and
+request latency percentiles. Nothing touches the real service::
+
+    python -m benchmarks.bench_extraction --concurrency 1,4,16 --latency 0.05
+
+With ``--adaptive`` each level runs that many fetch workers behind an
+`AdaptiveConcurrencyLimiter`, and the limit it settled on is reported::
+
+    python -m benchmarks.bench_extraction --concurrency 32 --rate-limit 100 --adaptive
+"""
+import time
+import asyncio
+import argparse
+import logging
+from requests.adapters import HTTPAdapter
+from eadconnect.client import EducationAPI
+from eadconnect.http.concurrency import AdaptiveConcurrencyLimiter
+from eadconnect.http.instrumentation import MetricsCollector
+from eadconnect.services.extraction_service import ExtractionPipeline
+from eadconnect.testing.mock_server import (
+    MockPlatformData,
+    MockPlatformServer,
+    make_token
+)
+
+
+def no_op_writer(course, topic, payload, manifest=None):
+    return None
+
+
+def make_client(server, concurrency, metrics, limiter=None):
+    client = EducationAPI(
+        "faesa",
+        "user",
+        "pass",
+        rate_limiter=None,
+        instrumentation=[metrics],
+        concurrency_limiter=limiter
+    )
+    client.URL_API = server.url
+    client.access_token = make_token()
+    client.mount('http://', HTTPAdapter(pool_maxsize=max(concurrency, 10)))
+    return client
+
+
+def run_level(server, courses, concurrency, adaptive=False):
+    metrics = MetricsCollector()
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=concurrency) if adaptive else None
+    client = make_client(server, concurrency, metrics, limiter)
+    pipeline = ExtractionPipeline(
+        client,
+        fetch_concurrency=concurrency,
+        write_workers=1,
+        queue_size=concurrency * 2,
+        writer=no_op_writer,
+        skip_unchanged=False
+    )
+    started = time.perf_counter()
+    asyncio.run(pipeline.run(courses))
+    elapsed = time.perf_counter() - started
+
+    topics = [row for row in metrics.summary() if row['endpoint'].endswith('/topics/{id}')]
+    latency = topics[0] if topics else {'p50': 0, 'p95': 0, 'p99': 0, 'max': 0}
+    fetched = pipeline.stats['fetch'].processed
+    client.close()
+    return {
+        'concurrency': concurrency,
+        'topics': fetched,
+        'failed': len(pipeline.failures),
+        'elapsed': elapsed,
+        'throughput': fetched / elapsed if elapsed else 0.0,
+        'p50': latency['p50'],
+        'p95': latency['p95'],
+        'p99': latency['p99'],
+        'max': latency['max'] or 0.0,
+        'limit': limiter.limit if limiter else concurrency,
+        'statuses': dict(server.statuses)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--concurrency', default='1,2,4,8,16')
+    parser.add_argument('--courses', type=int, default=4)
+    parser.add_argument('--topics', type=int, default=25)
+    parser.add_argument('--questions', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=0.0)
+    parser.add_argument('--adaptive', action='store_true')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    data = MockPlatformData(
+        courses=args.courses,
+        topics_per_course=args.topics,
+        questions_per_topic=args.questions
+    )
+    latency = (args.latency, args.latency + args.jitter) if args.jitter else args.latency
+    courses = [
+        {'id': course['id'], 'title': course['name'], 'course_name': f"course_{course['id']}"}
+        for course in data.courses
+    ]
+
+    print(f"{'conc':>5} {'topics':>7} {'failed':>7} {'time':>8} {'topics/s':>9} "
+          f"{'p50':>7} {'p95':>7} {'p99':>7} {'max':>7} {'limit':>6}  statuses")
+    for concurrency in (int(value) for value in args.concurrency.split(',')):
+        with MockPlatformServer(
+                data=data,
+                latency=latency,
+                error_rate=args.error_rate,
+                rate_limit=args.rate_limit
+        ) as server:
+            row = run_level(server, courses, concurrency, args.adaptive)
+        print(
+            f"{row['concurrency']:>5} {row['topics']:>7} {row['failed']:>7} "
+            f"{row['elapsed']:>7.2f}s {row['throughput']:>9.1f} {row['p50']:>6.3f}s "
+            f"{row['p95']:>6.3f}s {row['p99']:>6.3f}s {row['max']:>6.3f}s {row['limit']:>6}  "
+            f"{row['statuses']}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""Import-time benchmark and guard for the package's entry modules.
+
+Imports each module in a fresh interpreter (``python -X importtime``) and
+reports the wall time of the whole process and of the import, plus the
+slowest modules pulled in. It fails (exit status 1) when an import loads
+one of the optional heavy dependencies, configures logging or creates
+directories, or when ``--budget-ms`` is exceeded::
+
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --repeat 5 --budget-ms 150 eadconnect.client
+"""
+import sys
+import json
+import logging
+import time
+import argparse
+import subprocess
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+MODULES = (
+    'eadconnect.client',
+    'eadconnect.services.academic_service',
+    'eadconnect.services.notification_service',
+    'eadconnect.services.watcher',
+    'eadconnect.utils.file_manager',
+)
+
+# Loaded only by the feature that needs them, never by a plain import.
+HEAVY_MODULES = ('bs4', 'fpdf', 'telethon', 'toml', 'httpx', 'h2', 'google.genai')
+
+# Written by the child right before the import, so interpreter startup
+# (site, .pth files) is left out of the slowest imports.
+MARKER = '-- import --'
+
+CHILD = """
+import sys, json, time, logging, importlib
+sys.stderr.write({marker!r} + '\\n')
+started = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    'elapsed': elapsed,
+    'heavy': [name for name in {heavy!r} if name in sys.modules],
+    'handlers': len(logging.getLogger().handlers),
+    'level': logging.getLogger().level
+}}))
+"""
+
+
+def snapshot_dirs():
+    return {path for path in BASE_DIR.rglob('*') if path.is_dir() and '.git' not in path.parts}
+
+
+def parse_importtime(stderr, top=5):
+    """Return the ``top`` slowest imports as ``(cumulative_us, module)``."""
+    rows = []
+    for line in stderr.partition(MARKER)[2].splitlines():
+        # "import time:  <self us> | <cumulative us> | <indented module name>"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def measure(module):
+    code = CHILD.format(module=module, heavy=HEAVY_MODULES, marker=MARKER)
+    before = snapshot_dirs()
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True
+    )
+    wall = time.perf_counter() - started
+    created = sorted(str(path.relative_to(BASE_DIR)) for path in snapshot_dirs() - before)
+    if result.returncode:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.splitlines()[-1]}")
+
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    data.update(wall=wall, created=created, slowest=parse_importtime(result.stderr))
+    return data
+
+
+def problems(data, budget_ms=None):
+    found = []
+    if data['heavy']:
+        found.append(f"loads {', '.join(data['heavy'])}")
+    if data['handlers'] or data['level'] != logging.WARNING:
+        found.append("configures logging")
+    if data['created']:
+        found.append(f"creates {', '.join(data['created'])}")
+    if budget_ms and data['elapsed'] * 1000 > budget_ms:
+        found.append(f"import took {data['elapsed'] * 1000:.0f}ms > {budget_ms:g}ms")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--budget-ms', type=float, default=None)
+    parser.add_argument('--top', type=int, default=3)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<45} {'process':>9} {'import':>9}  slowest imports")
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run['elapsed'])
+        best['wall'] = min(run['wall'] for run in runs)
+        best['created'] = sorted({path for run in runs for path in run['created']})
+        slowest = ', '.join(f"{name} {us / 1000:.0f}ms" for us, name in best['slowest'][:args.top])
+        print(f"{module:<45} {best['wall'] * 1000:>7.0f}ms {best['elapsed'] * 1000:>7.0f}ms  {slowest}")
+        for problem in problems(best, args.budget_ms):
+            failed = True
+            print(f"  FAIL: {problem}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
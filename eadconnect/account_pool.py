@@ -0,0 +1,196 @@
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future
+from eadconnect.client import EducationAPI
+from eadconnect.config import accounts_path
+from eadconnect.http.navigator import (
+    DEFAULT_CIPHER_SUITE,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    CipherSuiteAdapter,
+    create_ssl_context,
+    retry_strategy
+)
+from eadconnect.http.ratelimit import RateLimiter
+from eadconnect.utils.auth import (
+    TokenManager,
+    TokenStore
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Account:
+    """One identity of the pool: its client, token lifecycle and pending jobs."""
+
+    def __init__(self, key, client, token_manager):
+        self.key = key
+        self.client = client
+        self.token_manager = token_manager
+        self.jobs = deque()
+        self.started = False
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        with self._lock:
+            if not self.started:
+                self.token_manager.start()
+                self.started = True
+
+
+class AccountPool:
+    """Run API work for many accounts over one shared connection pool.
+
+    Every `EducationAPI` added to the pool mounts the same
+    `CipherSuiteAdapter`, so TLS connections to the API host are reused across
+    identities, while headers, tokens and rate limits stay per account: each
+    account gets its own `RateLimiter` bucket and a `TokenManager` whose
+    token file lives under ``credentials_dir``. Accounts authenticate lazily
+    on their first job.
+
+    The adapter is built like `Browser`'s: its TLS context comes from
+    `create_ssl_context` (pass ``ssl_context`` to use another one), so
+    every account resumes the same TLS sessions, and ``pool_connections``,
+    ``pool_maxsize`` and ``pool_block`` size its connection pool.
+
+    Jobs are ``fn(client, *args, **kwargs)`` callables run on
+    ``max_workers`` threads. Accounts with pending work are served
+    round-robin, one job at a time, so an account with a long backlog cannot
+    starve the others.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = 8,
+            rate: float = 1.0,
+            burst: int = 2,
+            pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize: int = None,
+            pool_block: bool = False,
+            ssl_context=None,
+            credentials_dir=accounts_path
+    ):
+        self.max_workers = max_workers
+        self.rate = rate
+        self.burst = burst
+        self.credentials_dir = credentials_dir
+        self.ssl_context = ssl_context or create_ssl_context(DEFAULT_CIPHER_SUITE)
+        self.adapter = CipherSuiteAdapter(
+            ssl_context=self.ssl_context,
+            max_retries=retry_strategy,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize or max(max_workers, DEFAULT_POOL_MAXSIZE),
+            pool_block=pool_block
+        )
+        self.accounts = {}
+        self._ready = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._work, name=f"account-pool-{index}", daemon=True)
+            for index in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def add_account(self, key, institution: str, username: str, password: str, **kwargs):
+        """Register an identity and return its client."""
+        client = EducationAPI(
+            institution,
+            username,
+            password,
+            adapter=self.adapter,
+            ssl_context=self.ssl_context,
+            rate_limiter=RateLimiter(self.rate, self.burst),
+            **kwargs
+        )
+        store = TokenStore(self.credentials_dir / f"{key}.json")
+        with self._condition:
+            self.accounts[key] = Account(key, client, TokenManager(client, store=store))
+        return client
+
+    def remove_account(self, key):
+        with self._condition:
+            account = self.accounts.pop(key)
+            for _, future, _, _ in account.jobs:
+                future.cancel()
+            account.jobs.clear()
+        account.token_manager.stop()
+
+    def submit(self, key, fn, *args, **kwargs) -> Future:
+        """Queue ``fn(client, *args, **kwargs)`` for the account ``key``."""
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("AccountPool is shut down")
+
+            account = self.accounts[key]
+            account.jobs.append((fn, future, args, kwargs))
+            if key not in self._ready:
+                self._ready.append(key)
+            self._condition.notify()
+        return future
+
+    def map_accounts(self, fn, *args, **kwargs):
+        """Run ``fn`` once for every account, returning ``{key: Future}``."""
+        return {
+            key: self.submit(key, fn, *args, **kwargs)
+            for key in list(self.accounts)
+        }
+
+    def _next_job(self):
+        with self._condition:
+            while not self._ready and not self._closed:
+                self._condition.wait()
+            if not self._ready:
+                return None
+
+            key = self._ready.popleft()
+            account = self.accounts.get(key)
+            if account is None or not account.jobs:
+                return account, None
+            job = account.jobs.popleft()
+            if account.jobs:
+                self._ready.append(key)
+            return account, job
+
+    def _work(self):
+        while True:
+            item = self._next_job()
+            if item is None:
+                return
+
+            account, job = item
+            if job is None:
+                continue
+
+            fn, future, args, kwargs = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                account.ensure_started()
+                result = fn(account.client, *args, **kwargs)
+            except BaseException as e:
+                logger.exception(f"Job failed for account {account.key}: {e}")
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs, let queued ones finish and stop token refreshes."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+        for account in list(self.accounts.values()):
+            account.token_manager.stop()
+        self.adapter.close()
@@ -0,0 +1,345 @@
+from eadconnect.endpoints import Endpoints
+
+# List holding the items in the page returned by each paginated endpoint.
+ITEMS_KEYS = {
+    'get_messages': 'conversations',
+    'get_notices': 'notices',
+    'get_notices_board': 'notices',
+    'get_my_courses': 'courses',
+    'get_debts': 'debts',
+}
+
+class EducationAPIRequests(Endpoints):
+    """Requests of the platform API, shared by `EducationAPI` and `AsyncEducationAPI`.
+
+    Each ``*_request`` method returns the keyword arguments of
+    ``send_request`` (method, URL, query parameters, JSON body and headers);
+    the clients only send them through ``_call`` and page through them with
+    ``_pages``, so both build exactly the same requests.
+    """
+
+    institution: str
+    username: str
+    password: str
+    access_token: str
+    app_access_token: str
+
+    @property
+    def base_url(self):
+        return f'https://{self.institution.lower()}.grupoa.education'
+
+    def request_headers(self, access_token: str = None):
+        """Build the per-call headers layered over the immutable base headers."""
+        headers = {
+            'Referer': f"{self.base_url}/",
+            'Accept': 'application/json'
+        }
+        if access_token:
+            headers['Authorization'] = access_token
+
+        return headers
+
+    def _call(self, request):
+        raise NotImplementedError
+
+    def _pages(self, fetch, items_key, page_size, prefetch):
+        raise NotImplementedError
+
+    def login_request(self):
+        payload = {
+            'username': self.username,
+            'password': self.password,
+            'applicationAlias': 'plataforma',
+            'iesAlias': '107_1'
+        }
+        return dict(
+            method='POST',
+            url=f'{self.URL_API}/{self.CLIENT_AUTH}/signin/tenants/{self.institution.lower()}',
+            json=payload,
+            headers=self.request_headers()
+        )
+
+    def persist_access_token_request(self, access_token: str):
+        payload = {
+            'roleAlias': 'student',
+            'applicationAlias': 'plataforma',
+            'tenantAlias': f'{self.institution.lower()}',
+            'iesAlias': '107_1'
+        }
+        return dict(
+            method='PUT',
+            url=f'{self.URL_API}/{self.CLIENT_AUTH}/role/assume',
+            json=payload,
+            headers=self.request_headers(access_token)
+        )
+
+    def get_messages_request(self, page: int = 1, items_per_page: int = 15):
+        payload = {
+            'directory': 'inbox',
+            'page': page,
+            'perPage': items_per_page
+        }
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/v1/message/messages',
+            params=payload,
+            headers=self.request_headers(self.access_token)
+        )
+
+    def get_notices_request(self, page: int = 1, items_per_page: int = 15):
+        payload = {
+            'page': page,
+            'perPage': items_per_page,
+            'orderBy': 'postedAt:desc',
+        }
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/{self.PLATFORM_V1}/academic/notices-board',
+            params=payload,
+            headers=self.request_headers(self.access_token)
+        )
+
+    def get_notices_board_request(self, course_id: int = 2326262, page: int = 1, items_per_page: int = 5):
+        payload = {
+            'isHighlight': True,
+            'perPage': items_per_page,
+            'page': page,
+            'orderBy': 'sequence:asc'
+        }
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/{self.PLATFORM_V1}/academic/courses/{course_id}/notices-board',
+            params=payload,
+            headers=self.request_headers(self.access_token)
+        )
+
+    def get_me_request(self, access_token: str = None):
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/{self.USERS_INFO}/me',
+            headers=self.request_headers(access_token or self.access_token)
+        )
+
+    def get_periods_request(self):
+        payload = {
+            'academicMainTypeName': 'course',
+            'state': 'all'
+        }
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/{self.PLATFORM_V1}/academic/courses/period/me',
+            params=payload,
+            headers=self.request_headers(self.access_token)
+        )
+
+    def get_my_courses_request(
+            self,
+            state: str = "all",
+            period: int = 11903,
+            page: int = 1,
+            items_per_page: int = 20
+    ):
+        payload = {
+            'state': state,
+            'period': period,
+            'page': page,
+            'limit': items_per_page,
+            'sort': 'asc',
+            'sortBy': 'name',
+            'type': 'courses'
+        }
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/{self.PLATFORM_V1}/academic/courses/me',
+            params=payload,
+            headers=self.request_headers(self.access_token)
+        )
+
+    def get_contents_request(self, course_id: int):
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/{self.PLATFORM_V2}/content/academics-main/{course_id}/contents',
+            headers=self.request_headers(self.access_token)
+        )
+
+    def get_exercises_request(self, course_id: int, topic_id: int):
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/{self.PLATFORM_V2}/content/academics-main/{course_id}/topics/{topic_id}',
+            headers=self.request_headers(self.access_token)
+        )
+
+    def get_grades_request(self, course_id: int):
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/{self.PLATFORM_V1}/grades/me/course/{course_id}',
+            headers=self.request_headers(self.access_token)
+        )
+
+    def get_appointment_type_request(self):
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/{self.PLATFORM_V1}/calendar/appointment/type',
+            headers=self.request_headers(self.access_token)
+        )
+
+    def get_calendar_request(self, start_date: str, end_date: str):
+        payload = {
+            'appointmentCategory': '1,2,5,6',
+            'startDate': start_date,
+            'endDate': end_date
+        }
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/{self.PLATFORM_V1}/calendar/appointment',
+            params=payload,
+            headers=self.request_headers(self.access_token)
+        )
+
+    def auth_app_launcher_request(self):
+        params = {
+            'appLauncher': False
+        }
+        payload = {
+            'iesAlias': '107_1',
+            'roleAlias': 'student',
+            'tenantAlias': f'{self.institution.lower()}',
+            'uuid': self.username
+        }
+        return dict(
+            method='POST',
+            url=f'{self.URL_API}/{self.CLIENT_AUTH}/sso/applications/academic-services/url',
+            params=params,
+            json=payload,
+            headers=self.request_headers(self.access_token)
+        )
+
+    def get_my_info_request(self):
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/v1/academic-services/bff/my-informations',
+            headers=self.request_headers(self.app_access_token)
+        )
+
+    def get_debts_request(
+            self,
+            registration_number: str = None,
+            status: str = 'pending',
+            page: int = 1,
+            items_per_page: int = 10
+    ):
+        payload = {
+            'perPage': items_per_page,
+            'page': page,
+            'academicRecord': registration_number,
+            'filterYear': '',
+            'filterPeriod': '',
+            'filterType': '',
+            'filterStatusType': status,
+            'checkfitForAgreement': True,
+            'viewSlips': True,
+            'order': 'DESC|ASC|ASC|ASC|ASC',
+            'sortBy': 'warning_agreement|due_date|debt_number|competency_month|competency_year'
+        }
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/v1/service-portal/financial/debts',
+            params=payload,
+            headers=self.request_headers(self.app_access_token)
+        )
+
+    def get_contract_slip_request(self, contract_id: int):
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/v1/service-portal/financial/debts/{contract_id}',
+            headers=self.request_headers(self.app_access_token)
+        )
+
+    def get_payment_methods_request(self):
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/v1/service-portal/financial/payment/methods',
+            headers=self.request_headers(self.app_access_token)
+        )
+
+    def get_payment_settings_request(self):
+        return dict(
+            method='GET',
+            url=f'{self.URL_API}/{self.PLATFORM_V1}/service-portal/financial/settings',
+            headers=self.request_headers(self.app_access_token)
+        )
+
+    def create_payment_request(self, registration_number: str, payment_data: dict):
+        params = {
+            'academicRecord': registration_number,
+            'isAgreement': False
+        }
+        return dict(
+            method='POST',
+            url=f'{self.URL_API}/v1/service-portal/financial/payment/charges/pix',
+            params=params,
+            json=payment_data,
+            headers=self.request_headers(self.app_access_token)
+        )
+
+    def iter_messages(self, items_per_page: int = 15, prefetch: bool = False):
+        """Iterate over every inbox conversation, fetching pages lazily."""
+        return self._pages(
+            lambda page, per_page: self.get_messages(page, per_page),
+            ITEMS_KEYS['get_messages'],
+            items_per_page,
+            prefetch
+        )
+
+    def iter_notices(self, items_per_page: int = 15, prefetch: bool = False):
+        """Iterate over every notice of the user, fetching pages lazily."""
+        return self._pages(
+            lambda page, per_page: self.get_notices(page, per_page),
+            ITEMS_KEYS['get_notices'],
+            items_per_page,
+            prefetch
+        )
+
+    def iter_notices_board(
+            self,
+            course_id: int = 2326262,
+            items_per_page: int = 5,
+            prefetch: bool = False
+    ):
+        """Iterate over every notice of a course board, fetching pages lazily."""
+        return self._pages(
+            lambda page, per_page: self.get_notices_board(course_id, page, per_page),
+            ITEMS_KEYS['get_notices_board'],
+            items_per_page,
+            prefetch
+        )
+
+    def iter_my_courses(
+            self,
+            state: str = "all",
+            period: int = 11903,
+            items_per_page: int = 20,
+            prefetch: bool = False
+    ):
+        """Iterate over every course of the user, fetching pages lazily."""
+        return self._pages(
+            lambda page, per_page: self.get_my_courses(state, period, page, per_page),
+            ITEMS_KEYS['get_my_courses'],
+            items_per_page,
+            prefetch
+        )
+
+    def iter_debts(
+            self,
+            registration_number: str = None,
+            status: str = 'pending',
+            items_per_page: int = 10,
+            prefetch: bool = False
+    ):
+        """Iterate over every debt of the user, fetching pages lazily."""
+        return self._pages(
+            lambda page, per_page: self.get_debts(registration_number, status, page, per_page),
+            ITEMS_KEYS['get_debts'],
+            items_per_page,
+            prefetch
+        )
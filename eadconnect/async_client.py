@@ -0,0 +1,129 @@
+from eadconnect.http.async_navigator import AsyncBrowser
+from eadconnect.api import EducationAPIRequests
+from eadconnect.utils.pagination import aiter_pages
+
+
+class AsyncEducationAPI(AsyncBrowser, EducationAPIRequests):
+    """Asyncio version of `EducationAPI` with the same method surface.
+
+    Usage::
+
+        async with AsyncEducationAPI("faesa", username, password) as client:
+            client.access_token = access_token
+            grades = await asyncio.gather(
+                *(client.get_grades(course['id']) for course in courses)
+            )
+    """
+
+    def __init__(
+            self,
+            institution: str = "faesa",
+            username: str = None,
+            password: str = None,
+            *args,
+            **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.institution = institution
+        self.username = username
+        self.password = password
+        self.access_token = None
+        self.app_access_token = None
+        self.set_headers()
+
+    async def _call(self, request):
+        response = await self.send_request(**request)
+        if response.is_success:
+            return response.json()
+
+        return response
+
+    def _pages(self, fetch, items_key, page_size, prefetch):
+        return aiter_pages(fetch, items_key=items_key, page_size=page_size, prefetch=prefetch)
+
+    async def login(self):
+        return await self._call(self.login_request())
+
+    async def persist_access_token(self, access_token: str):
+        return await self._call(self.persist_access_token_request(access_token))
+
+    async def get_messages(self, page: int = 1, items_per_page: int = 15):
+        return await self._call(self.get_messages_request(page, items_per_page))
+
+    async def get_notices(self, page: int = 1, items_per_page: int = 15):
+        """Retrieve the notices for the user."""
+        return await self._call(self.get_notices_request(page, items_per_page))
+
+    async def get_notices_board(self, course_id: int = 2326262, page: int = 1, items_per_page: int = 5):
+        """Retrieve the notice board for the user."""
+        return await self._call(self.get_notices_board_request(course_id, page, items_per_page))
+
+    async def check_me(self, access_token: str):
+        return await self._call(self.get_me_request(access_token))
+
+    async def get_me(self, access_token: str = None):
+        return await self._call(self.get_me_request(access_token))
+
+    async def get_periods(self):
+        """Retrieve the academic periods for the user."""
+        return await self._call(self.get_periods_request())
+
+    async def get_my_courses(
+            self,
+            state: str = "all",
+            period: int = 11903,
+            page: int = 1,
+            items_per_page: int = 20
+    ):
+        return await self._call(self.get_my_courses_request(state, period, page, items_per_page))
+
+    async def get_contents(self, course_id: int):
+        return await self._call(self.get_contents_request(course_id))
+
+    async def get_exercises(self, course_id: int, topic_id: int):
+        return await self._call(self.get_exercises_request(course_id, topic_id))
+
+    async def get_grades(self, course_id: int):
+        return await self._call(self.get_grades_request(course_id))
+
+    async def get_appointment_type(self):
+        """Retrieve the appointments for the user."""
+        return await self._call(self.get_appointment_type_request())
+
+    async def get_calendar(self, start_date: str, end_date: str):
+        """Retrieve the academic calendar for a specific course."""
+        return await self._call(self.get_calendar_request(start_date, end_date))
+
+    async def auth_app_launcher(self):
+        """Authenticate the app launcher."""
+        return await self._call(self.auth_app_launcher_request())
+
+    async def get_my_info(self):
+        """Retrieve the user profile information."""
+        return await self._call(self.get_my_info_request())
+
+    async def get_debts(
+            self,
+            registration_number: str = None,
+            status: str = 'pending',
+            page: int = 1,
+            items_per_page: int = 10
+    ):
+        """Retrieve the user's debts."""
+        return await self._call(self.get_debts_request(registration_number, status, page, items_per_page))
+
+    async def get_contract_slip(self, contract_id: int):
+        """Retrieve the slip for a specific debt."""
+        return await self._call(self.get_contract_slip_request(contract_id))
+
+    async def get_payment_methods(self):
+        """Retrieve the available payment methods."""
+        return await self._call(self.get_payment_methods_request())
+
+    async def get_payment_settings(self):
+        """Retrieve the payment settings for the user."""
+        return await self._call(self.get_payment_settings_request())
+
+    async def create_payment(self, registration_number: str, payment_data: dict):
+        """Create a payment for the user register."""
+        return await self._call(self.create_payment_request(registration_number, payment_data))
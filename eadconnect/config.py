@@ -1,4 +1,3 @@
-import toml
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -10,14 +9,16 @@ pdf_path = BASE_DIR / "src/pdfs"
 json_path = BASE_DIR / "src/json"
 logo_path = BASE_DIR / "src/img"
 font_path = BASE_DIR / "src/fonts"
+cache_path = BASE_DIR / "src/cache"
+accounts_path = BASE_DIR / "src/accounts"
+history_path = BASE_DIR / "src/history"
 logo_file = logo_path / "logo.png"
 
-for path in [pdf_path, json_path, font_path, logo_path]:
-    path.mkdir(parents=True, exist_ok=True)
-
 
 def load_configurations():
     if CONFIGURATIONS.exists():
+        import toml
+
         config = toml.load(CONFIGURATIONS)
         return config
 
@@ -25,6 +26,8 @@ def load_configurations():
 
 
 def save_credentials(username, password):
+    import toml
+
     config = {
         "auth": {
             "username": username,
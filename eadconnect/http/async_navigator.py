@@ -0,0 +1,175 @@
+import time
+import asyncio
+import logging
+from types import MappingProxyType
+import httpx
+from eadconnect.http.navigator import (
+    DEFAULT_CIPHER_SUITE,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    create_ssl_context
+)
+from eadconnect.http.retry import (
+    CircuitOpenError,
+    RetryManager
+)
+from eadconnect.http.instrumentation import (
+    RequestEvent,
+    emit
+)
+
+
+class AsyncBrowser:
+    """Asyncio counterpart of `Browser` built on `httpx.AsyncClient`.
+
+    The TLS context comes from the same `create_ssl_context` as
+    `CipherSuiteAdapter`, so ``server_hostname`` and TLS session resumption
+    also apply to the memory BIOs httpx handshakes through, and failed
+    requests are retried by the same `RetryManager` loop as `Browser`. The
+    response cache and cassettes are only available on `Browser`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.headers = MappingProxyType({})
+        self.ecdhCurve = kwargs.pop('ecdhCurve', 'prime256v1')
+        self.cipherSuite = kwargs.pop('cipherSuite', DEFAULT_CIPHER_SUITE)
+        self.source_address = kwargs.pop('source_address', None)
+        self.server_hostname = kwargs.pop('server_hostname', None)
+        self.ssl_context = kwargs.pop('ssl_context', None)
+        self.timeout = kwargs.pop('timeout', 30)
+        self.rate_limiter = kwargs.pop('rate_limiter', None)
+        self.instrumentation = list(kwargs.pop('instrumentation', []))
+        self.retry = kwargs.pop('retry', None) or RetryManager()
+        self.concurrency_limiter = kwargs.pop('concurrency_limiter', None)
+        self.pool_connections = kwargs.pop('pool_connections', DEFAULT_POOL_CONNECTIONS)
+        self.pool_maxsize = kwargs.pop('pool_maxsize', DEFAULT_POOL_MAXSIZE)
+        self.keep_alive = kwargs.pop('keep_alive', True)
+        self.http2 = kwargs.pop('http2', False)
+
+        if not self.ssl_context:
+            self.ssl_context = create_ssl_context(
+                self.cipherSuite,
+                self.ecdhCurve,
+                self.server_hostname
+            )
+
+        local_address = self.source_address
+        if isinstance(local_address, tuple):
+            local_address = local_address[0]
+
+        self.session = httpx.AsyncClient(
+            timeout=self.timeout,
+            transport=httpx.AsyncHTTPTransport(
+                verify=self.ssl_context,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.pool_maxsize,
+                    max_keepalive_connections=self.pool_connections if self.keep_alive else 0
+                ),
+                local_address=local_address
+            )
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        await self.session.aclose()
+
+    def set_headers(self, headers=None):
+        """Replace the read-only base headers shared by every request."""
+        base_headers = {
+            "User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/119.0",
+            "X-User-Timezone": "America/Sao_Paulo"
+        }
+        if headers:
+            for key, value in headers.items():
+                base_headers[key] = value
+
+        self.headers = MappingProxyType(base_headers)
+
+    def get_headers(self, headers=None):
+        """Return the base headers merged with the per-call ``headers``."""
+        merged = dict(self.headers)
+        if headers:
+            merged.update(headers)
+
+        return merged
+
+    def add_instrumentation(self, hook):
+        """Register ``hook(event)`` to receive a `RequestEvent` per request."""
+        self.instrumentation.append(hook)
+
+    async def _send_once(self, method, url, headers, **kwargs):
+        if not self.concurrency_limiter:
+            return await self.session.request(method, url, headers=headers, **kwargs)
+
+        started = await self.concurrency_limiter.acquire_async()
+        response = error = None
+        try:
+            response = await self.session.request(method, url, headers=headers, **kwargs)
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.concurrency_limiter.release(started, getattr(response, 'status_code', None), error)
+
+    async def send_request(self, method, url, headers=None, **kwargs):
+        started = time.perf_counter()
+        response = error = None
+        try:
+            response = await self._request_with_retries(method, url, self.get_headers(headers), **kwargs)
+            if not response.is_success:
+                logging.error(f"Request failed with status code: {response.status_code}")
+            else:
+                logging.info(f"Request succeeded with status code: {response.status_code}")
+            return response
+        except CircuitOpenError as e:
+            logging.warning(str(e))
+            response = httpx.Response(503, headers=e.headers, request=httpx.Request(method, url))
+            response.from_circuit_breaker = True
+            return response
+        except Exception as e:
+            error = e
+            logging.exception(f"An error occurred while making a request: {e}")
+            return None
+        finally:
+            if self.instrumentation:
+                emit(
+                    self.instrumentation,
+                    RequestEvent.from_response(
+                        method,
+                        url,
+                        time.perf_counter() - started,
+                        response,
+                        error
+                    )
+                )
+
+    async def _request_with_retries(self, method, url, headers, **kwargs):
+        call = self.retry.call(method, url)
+        while call.proceed():
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(url)
+
+            logging.info(f"Sending {method} request to: {url}")
+            try:
+                response = await self._send_once(method, url, headers, **kwargs)
+            except httpx.TransportError as e:
+                delay = call.failed(e)
+                if delay is None:
+                    raise
+            except BaseException as e:
+                call.aborted(e)
+                raise
+            else:
+                delay = call.received(response)
+                if delay is None:
+                    break
+
+            await asyncio.sleep(delay)
+        return call.response
@@ -0,0 +1,215 @@
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from eadconnect.config import cache_path
+from eadconnect.utils.auth import token_claims
+
+ONE_DAY = 24 * 60 * 60
+
+# The body is stored already decoded, so these no longer describe it.
+TRANSPORT_HEADERS = ('Content-Encoding', 'Content-Length', 'Transfer-Encoding')
+
+# Only endpoints listed here are cached; course content hardly ever changes.
+DEFAULT_TTLS = {
+    r'/content/academics-main/\d+/contents$': ONE_DAY,
+    r'/content/academics-main/\d+/topics/\d+$': ONE_DAY,
+}
+
+
+def build_response(status_code, headers, content, url, reason=None):
+    """Build a `requests.Response` out of stored data."""
+    response = Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.url = url
+    response.reason = reason or ('OK' if status_code < 400 else '')
+    response.encoding = get_encoding_from_headers(response.headers)
+    return response
+
+
+def account_identity(authorization):
+    """Who a request is sent as, stable across token refreshes.
+
+    A JWT names its account in the ``iss``/``sub`` claims, whatever token
+    was issued for it; any other token is its own identity.
+    """
+    claims = token_claims(authorization)
+    if claims and claims.get('sub'):
+        return json.dumps([claims.get('iss'), claims['sub']], default=str)
+    return authorization or ''
+
+
+class CacheEntry:
+    __slots__ = ('status_code', 'headers', 'content', 'url', 'expires_at')
+
+    def __init__(self, status_code, headers, content, url, expires_at):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.expires_at = expires_at
+
+    @property
+    def is_fresh(self):
+        return self.expires_at > time.time()
+
+    def validators(self):
+        """Conditional headers to revalidate a stale entry with the server."""
+        headers = {}
+        if self.headers.get('ETag'):
+            headers['If-None-Match'] = self.headers['ETag']
+        if self.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = self.headers['Last-Modified']
+        return headers
+
+    def to_response(self):
+        response = build_response(self.status_code, self.headers, self.content, self.url)
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """Disk-backed cache of GET responses used by `Browser.send_request`.
+
+    Entries are keyed by method, URL, query parameters and the account
+    behind the ``Authorization`` header (see `account_identity`), so they
+    survive token refreshes; they expire after the TTL of the first pattern
+    in ``ttls`` matching the URL and are evicted least-recently-used first
+    once the stored bodies exceed ``max_size`` bytes. Stale entries carrying
+    ``ETag``/``Last-Modified`` are revalidated with a conditional request.
+    """
+
+    def __init__(self, path=None, ttls=None, default_ttl: int = 0, max_size: int = 256 * 1024 * 1024):
+        self.path = Path(path or cache_path / "responses.sqlite3")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = [
+            (re.compile(pattern), ttl)
+            for pattern, ttl in (DEFAULT_TTLS if ttls is None else ttls).items()
+        ]
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+            """
+        )
+
+    def ttl_for(self, url):
+        """Return the TTL in seconds configured for ``url`` (0 disables caching)."""
+        path = url.split('?', 1)[0]
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def make_key(method, url, params=None, headers=None):
+        authorization = CaseInsensitiveDict(headers or {}).get('Authorization')
+        identity = hashlib.sha256(account_identity(authorization).encode()).hexdigest()
+        params = sorted((params or {}).items())
+        raw = json.dumps([method.upper(), url, params, identity], default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, headers, content, url, expires_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if not row:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key)
+            )
+            self._connection.commit()
+
+        status_code, headers, content, url, expires_at = row
+        return CacheEntry(
+            status_code,
+            CaseInsensitiveDict(json.loads(headers)),
+            content,
+            url,
+            expires_at
+        )
+
+    def set(self, key, response, ttl):
+        content = response.content
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.title() not in TRANSPORT_HEADERS
+        }
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    json.dumps(headers),
+                    content,
+                    len(content),
+                    now + ttl,
+                    now
+                )
+            )
+            self._evict()
+            self._connection.commit()
+
+    def refresh(self, key, ttl):
+        """Extend the life of an entry the server confirmed as unchanged."""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ? WHERE key = ?",
+                (now + ttl, now, key)
+            )
+            self._connection.commit()
+
+    def _evict(self):
+        total = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        stale = []
+        for key, size in rows:
+            if total <= self.max_size:
+                break
+            stale.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
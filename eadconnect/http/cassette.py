@@ -0,0 +1,190 @@
+import json
+import gzip
+import atexit
+import base64
+import threading
+from pathlib import Path
+from urllib.parse import urlencode
+from eadconnect.http.cache import (
+    TRANSPORT_HEADERS,
+    build_response
+)
+
+RECORD = "record"
+REPLAY = "replay"
+REDACTED = "REDACTED"
+
+SECRET_HEADERS = frozenset(('authorization', 'cookie', 'set-cookie', 'proxy-authorization'))
+SECRET_FIELDS = frozenset((
+    'password', 'accesstoken', 'refreshtoken', 'token', 'idtoken', 'secret', 'bot_token'
+))
+
+
+class CassetteMiss(KeyError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+def redact(value):
+    """Copy of a JSON value with every secret field replaced by ``REDACTED``."""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key.lower() in SECRET_FIELDS and value[key] else redact(value[key])
+            for key in value
+        }
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+def _redact_body(content):
+    try:
+        return json.dumps(redact(json.loads(content)), separators=(',', ':')).encode()
+    except (ValueError, UnicodeDecodeError):
+        return content
+
+
+def _request_body(kwargs):
+    if kwargs.get('json') is not None:
+        return json.dumps(redact(kwargs['json']), sort_keys=True, separators=(',', ':'))
+    data = kwargs.get('data')
+    if isinstance(data, dict):
+        return urlencode(sorted(redact(data).items()))
+    if isinstance(data, bytes):
+        return data.decode('utf-8', 'replace')
+    return data or ''
+
+
+class Cassette:
+    """Records `Browser` traffic to a file and serves it back without network.
+
+    In ``record`` mode every request/response is appended to ``path`` as one
+    gzip-compressed JSON line, with credentials removed (``Authorization``
+    and cookie headers, passwords and tokens in JSON bodies). In ``replay``
+    mode the file is loaded once into a dict keyed by method, URL, query
+    parameters and request body; repeated requests get the recorded
+    responses in order, the last one being repeated once they run out, and
+    a request that was never recorded raises `CassetteMiss` out of
+    `Browser.send_request`.
+
+    Usage::
+
+        client = EducationAPI("faesa", user, password, cassette=Cassette("run.jsonl.gz", "record"))
+        client = EducationAPI("faesa", cassette=Cassette("run.jsonl.gz"))
+    """
+
+    def __init__(self, path, mode: str = REPLAY, match_body: bool = True):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"mode must be '{RECORD}' or '{REPLAY}'")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.match_body = match_body
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._index = {}
+        self._positions = {}
+        self._file = None
+        if mode == REPLAY:
+            self._load()
+
+    @property
+    def replaying(self):
+        return self.mode == REPLAY
+
+    def _key(self, method, url, params, body):
+        items = params.items() if isinstance(params, dict) else params or []
+        query = urlencode(sorted((key, value) for key, value in items), doseq=True)
+        return method.upper(), url, query, body if self.match_body else ''
+
+    def _load(self):
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                request = entry['request']
+                key = self._key(request['method'], request['url'], request['params'], request['body'])
+                self._index.setdefault(key, []).append(entry['response'])
+
+    def play(self, method, url, **kwargs):
+        """Return the recorded response for this request."""
+        key = self._key(method, url, kwargs.get('params'), _request_body(kwargs))
+        with self._lock:
+            responses = self._index.get(key)
+            if not responses:
+                self.misses += 1
+                method, url, query, body = key
+                raise CassetteMiss(
+                    f"No recorded response for {method} {url}"
+                    + (f"?{query}" if query else '')
+                    + (f" with body {body!r}" if body else '')
+                )
+
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            self.hits += 1
+
+        recorded = responses[min(position, len(responses) - 1)]
+        if recorded.get('encoding') == 'base64':
+            content = base64.b64decode(recorded['content'])
+        else:
+            content = recorded['content'].encode('utf-8')
+        response = build_response(
+            recorded['status_code'],
+            recorded['headers'],
+            content,
+            recorded['url'],
+            recorded.get('reason')
+        )
+        response.from_cassette = True
+        return response
+
+    def record(self, method, url, response, **kwargs):
+        """Append a request/response pair to the cassette file."""
+        content = _redact_body(response.content or b'')
+        try:
+            stored_content, encoding = content.decode('utf-8'), 'utf-8'
+        except UnicodeDecodeError:
+            stored_content, encoding = base64.b64encode(content).decode('ascii'), 'base64'
+
+        entry = {
+            'request': {
+                'method': method.upper(),
+                'url': url,
+                'params': sorted([key, value] for key, value in (kwargs.get('params') or {}).items()),
+                'body': _request_body(kwargs)
+            },
+            'response': {
+                'status_code': response.status_code,
+                'reason': response.reason,
+                'url': response.url,
+                'headers': {
+                    name: value for name, value in response.headers.items()
+                    if name.lower() not in SECRET_HEADERS and name.title() not in TRANSPORT_HEADERS
+                },
+                'content': stored_content,
+                'encoding': encoding
+            }
+        }
+        line = json.dumps(entry, separators=(',', ':'), default=str) + '\n'
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = gzip.open(self.path, 'at', encoding='utf-8')
+                atexit.register(self.close)
+            self._file.write(line)
+
+    def close(self):
+        """Finish the gzip stream; the cassette is complete only after this."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
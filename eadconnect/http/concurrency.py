@@ -0,0 +1,214 @@
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+
+INCREASE = "increase"
+DECREASE = "decrease"
+
+# Responses meaning "too much load": the limit is cut when one arrives.
+OVERLOAD_STATUSES = frozenset((429, 503))
+
+
+class LimitDecision:
+    """One change of the limit, kept in `AdaptiveConcurrencyLimiter.decisions`."""
+
+    __slots__ = ('at', 'action', 'before', 'after', 'reason')
+
+    def __init__(self, action, before, after, reason):
+        self.at = time.time()
+        self.action = action
+        self.before = before
+        self.after = after
+        self.reason = reason
+
+    def as_dict(self):
+        return {
+            'at': self.at,
+            'action': self.action,
+            'before': self.before,
+            'after': self.after,
+            'reason': self.reason
+        }
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on the requests in flight, shared by threads and coroutines.
+
+    Every request holds a slot between `acquire` and `release`. Each
+    successful response while the limit is in use adds ``increase / limit``
+    to it (one more slot per round of successes); a 429/503, a connection
+    error or a latency spike (the smoothed latency above
+    ``latency_tolerance`` times its long-term baseline) multiplies it by
+    ``decrease``, at most once per ``cooldown`` seconds (the smoothed
+    latency by default), so a burst of failures from one round counts once.
+
+    ``limit``, `stats` and ``decisions`` show what the controller is doing.
+
+    Usage::
+
+        limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=32)
+        client = EducationAPI("faesa", username, password, concurrency_limiter=limiter)
+    """
+
+    def __init__(
+            self,
+            initial: int = 4,
+            min_limit: int = 1,
+            max_limit: int = 64,
+            increase: float = 1.0,
+            decrease: float = 0.5,
+            latency_tolerance: float = 2.0,
+            cooldown: float = None,
+            history: int = 100
+    ):
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.decisions = deque(maxlen=history)
+        self.latency = None
+        self.baseline = None
+        self.samples = 0
+        self._limit = float(max(min_limit, min(initial, max_limit)))
+        self._in_flight = 0
+        self._waiters = deque()
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self):
+        return int(self._limit)
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def stats(self):
+        with self._lock:
+            return {
+                'limit': int(self._limit),
+                'in_flight': self._in_flight,
+                'waiting': len(self._waiters),
+                'latency': self.latency,
+                'baseline': self.baseline,
+                'samples': self.samples,
+                'decreases': sum(decision.action == DECREASE for decision in self.decisions)
+            }
+
+    # Slots
+
+    def _grant(self):
+        """Hand free slots to waiters, in arrival order. Call with the lock held."""
+        while self._waiters and self._in_flight < int(self._limit):
+            waiter = self._waiters.popleft()
+            self._in_flight += 1
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+            else:
+                loop, future = waiter
+                loop.call_soon_threadsafe(_resolve, future)
+
+    def acquire(self):
+        """Block until a slot is free; returns the start time to pass to `release`."""
+        with self._lock:
+            if not self._waiters and self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return time.monotonic()
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+        return time.monotonic()
+
+    async def acquire_async(self):
+        """Coroutine version of `acquire`; never blocks the event loop."""
+        with self._lock:
+            if not self._waiters and self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return time.monotonic()
+            loop = asyncio.get_running_loop()
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    self._in_flight -= 1
+                    self._grant()
+            raise
+        return time.monotonic()
+
+    def release(self, started: float, status_code: int = None, error: BaseException = None):
+        """Free the slot and adjust the limit from how the request went."""
+        elapsed = time.monotonic() - started
+        with self._lock:
+            self._in_flight -= 1
+            if error is not None:
+                self._decrease(f"error: {type(error).__name__}")
+            elif status_code in OVERLOAD_STATUSES:
+                self._decrease(f"status {status_code}")
+            else:
+                self._observe(elapsed)
+                if self._latency_spike():
+                    self._decrease(
+                        f"latency {self.latency * 1000:.0f}ms > "
+                        f"{self.latency_tolerance:g}x baseline {self.baseline * 1000:.0f}ms"
+                    )
+                elif status_code is None or status_code < 500:
+                    self._increase(self._in_flight + 1)
+            self._grant()
+
+    # Control
+
+    def _observe(self, elapsed):
+        self.samples += 1
+        if self.latency is None:
+            self.latency = self.baseline = elapsed
+            return
+        self.latency += 0.3 * (elapsed - self.latency)
+        self.baseline += 0.02 * (elapsed - self.baseline)
+
+    def _latency_spike(self):
+        return (
+            self.samples >= 10
+            and self.baseline
+            and self.latency > self.baseline * self.latency_tolerance
+        )
+
+    def _record(self, action, before, reason):
+        after = int(self._limit)
+        if after != before:
+            self.decisions.append(LimitDecision(action, before, after, reason))
+            logging.debug(f"Concurrency limit {action}: {before} -> {after} ({reason})")
+
+    def _increase(self, used):
+        # Only grow a limit that is actually being used.
+        if used < int(self._limit) or self._limit >= self.max_limit:
+            return
+        before = int(self._limit)
+        self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+        self._record(INCREASE, before, "healthy responses")
+
+    def _decrease(self, reason):
+        now = time.monotonic()
+        cooldown = self.cooldown if self.cooldown is not None else (self.latency or 0.0)
+        if now - self._last_decrease < cooldown:
+            return
+        self._last_decrease = now
+        before = int(self._limit)
+        self._limit = max(self.min_limit, self._limit * self.decrease)
+        self._record(DECREASE, before, reason)
+
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(None)
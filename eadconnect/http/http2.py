@@ -0,0 +1,107 @@
+import httpx
+from requests.adapters import BaseAdapter
+from requests.exceptions import (
+    ConnectionError,
+    ConnectTimeout,
+    ReadTimeout
+)
+from eadconnect.http.cache import (
+    TRANSPORT_HEADERS,
+    build_response
+)
+
+
+def _timeout(timeout):
+    """Translate a requests timeout (seconds or ``(connect, read)``) for httpx."""
+    if timeout is None:
+        return httpx.Timeout(None)
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(None, connect=connect, read=read)
+    return httpx.Timeout(timeout)
+
+
+class HTTP2Adapter(BaseAdapter):
+    """requests adapter sending through an HTTP/2 `httpx.Client`.
+
+    Mounted by `Browser` when created with ``http2=True``: concurrent
+    requests to the API host are multiplexed over a few TLS connections
+    opened with the same cipher-suite/ECDH ``ssl_context`` as
+    `CipherSuiteAdapter`, falling back to HTTP/1.1 when the server does not
+    negotiate ``h2``. Needs the ``h2`` package (``pip install httpx[http2]``).
+
+    As with `HTTPAdapter`, ``pool_block`` makes requests wait for one of the
+    ``pool_maxsize`` connections; otherwise extra connections are opened
+    when the pool is busy, and only ``pool_maxsize`` are kept alive.
+
+    Responses are read whole and returned as regular `requests.Response`
+    objects; cookies set by the server are not copied into the session jar,
+    which the token-based API does not need.
+    """
+
+    def __init__(
+            self,
+            ssl_context,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            keepalive_expiry: float = 5.0,
+            source_address=None,
+            retries: int = 0
+    ):
+        super(HTTP2Adapter, self).__init__()
+        if isinstance(source_address, tuple):
+            source_address = source_address[0]
+
+        self.limits = httpx.Limits(
+            max_connections=pool_maxsize if pool_block else None,
+            max_keepalive_connections=pool_maxsize if keep_alive else 0,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                verify=ssl_context,
+                http2=True,
+                limits=self.limits,
+                local_address=source_address,
+                retries=retries
+            )
+        )
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        try:
+            reply = self.client.request(
+                request.method,
+                request.url,
+                headers=request.headers,
+                content=request.body,
+                timeout=_timeout(timeout)
+            )
+        except httpx.ConnectTimeout as e:
+            raise ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise ReadTimeout(e, request=request)
+        except httpx.TransportError as e:
+            raise ConnectionError(e, request=request)
+
+        # The body is already decoded, so the transport headers no longer apply.
+        headers = {
+            name: value for name, value in reply.headers.items()
+            if name.title() not in TRANSPORT_HEADERS
+        }
+        response = build_response(
+            reply.status_code,
+            headers,
+            reply.content,
+            str(reply.url),
+            reply.reason_phrase
+        )
+        response.request = request
+        response.connection = self
+        # httpx times the whole exchange; the closest it has to a ttfb.
+        response.elapsed = reply.elapsed
+        response.http_version = reply.http_version
+        return response
+
+    def close(self):
+        self.client.close()
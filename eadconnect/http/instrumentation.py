@@ -0,0 +1,246 @@
+import re
+import bisect
+import logging
+import threading
+from collections import Counter
+from urllib.parse import urlsplit
+from requests import Response
+
+_ID_SEGMENT = re.compile(r'^(\d+|[0-9a-fA-F-]{32,36})$')
+
+# Upper bounds, in seconds, of the latency histogram buckets: 1ms to ~1min,
+# each bucket 25% wider than the previous one.
+LATENCY_BUCKETS = tuple(0.001 * 1.25 ** index for index in range(50)) + (float('inf'),)
+
+# Set on responses built locally (cache hit, cassette replay, open circuit).
+LOCAL_RESPONSE_FLAGS = ('from_cache', 'from_cassette', 'from_circuit_breaker')
+
+
+def endpoint_template(url):
+    """Collapse ids in the path so all calls to one endpoint share a key.
+
+    ``.../academics-main/3187911/topics/42?x=1`` becomes
+    ``.../academics-main/{id}/topics/{id}``.
+    """
+    path = urlsplit(url).path
+    return '/'.join(
+        '{id}' if _ID_SEGMENT.match(segment) else segment
+        for segment in path.split('/')
+    )
+
+
+def _body_size(body):
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode())
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return 0
+
+
+def _ttfb(response):
+    """Seconds until the headers of ``response`` arrived, when known.
+
+    Only requests measures it, and only for responses that went over the
+    wire: httpx's ``elapsed`` also covers the body (and raises on a response
+    that was never sent), and local responses were not timed at all.
+    """
+    if not isinstance(response, Response):
+        return None
+    if any(getattr(response, flag, False) for flag in LOCAL_RESPONSE_FLAGS):
+        return None
+    return response.elapsed.total_seconds()
+
+
+class RequestEvent:
+    """What `Browser.send_request` reports to the instrumentation hooks.
+
+    ``ttfb`` is the time until the response headers arrived (the
+    ``elapsed`` measured by requests, None for local responses and for
+    `AsyncBrowser`); ``elapsed`` also covers reading the body, retries and
+    local overhead. requests does not expose DNS, connect and TLS timings,
+    so those are not reported.
+    """
+
+    __slots__ = (
+        'method', 'url', 'endpoint', 'status_code', 'elapsed', 'ttfb',
+        'retries', 'request_bytes', 'response_bytes', 'from_cache', 'error'
+    )
+
+    def __init__(
+            self,
+            method,
+            url,
+            elapsed,
+            response=None,
+            retries=0,
+            error=None,
+            ttfb=None
+    ):
+        self.method = method.upper()
+        self.url = url
+        self.endpoint = endpoint_template(url)
+        self.elapsed = elapsed
+        self.error = error
+        self.retries = retries
+        self.status_code = getattr(response, 'status_code', None)
+        self.from_cache = getattr(response, 'from_cache', False)
+        self.ttfb = ttfb
+        self.request_bytes = 0
+        self.response_bytes = 0
+        if response is not None:
+            request = getattr(response, 'request', None)
+            self.request_bytes = _body_size(getattr(request, 'content', None) or getattr(request, 'body', None))
+            self.response_bytes = len(response.content or b'')
+
+    @classmethod
+    def from_response(cls, method, url, elapsed, response=None, error=None):
+        """Build the event counting the retries of `RetryCall` and of urllib3."""
+        retries = getattr(response, 'retry_count', 0)
+        raw_retries = getattr(getattr(response, 'raw', None), 'retries', None)
+        if raw_retries is not None:
+            retries += len(raw_retries.history)
+        return cls(method, url, elapsed, response, retries, error, _ttfb(response))
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (see `LATENCY_BUCKETS`)."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent):
+        """Estimate a percentile, interpolating inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets, self.counts):
+            if count and seen + count >= rank:
+                lower = max(lower, self.min)
+                upper = min(bound, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.max
+
+
+class EndpointMetrics:
+    def __init__(self, method, endpoint):
+        self.method = method
+        self.endpoint = endpoint
+        self.latency = LatencyHistogram()
+        self.ttfb = LatencyHistogram()
+        self.statuses = Counter()
+        self.retries = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def record(self, event):
+        self.latency.record(event.elapsed)
+        if event.ttfb is not None:
+            self.ttfb.record(event.ttfb)
+        self.statuses[event.status_code or 'error'] += 1
+        self.retries += event.retries
+        self.errors += bool(event.error)
+        self.cache_hits += bool(event.from_cache)
+        self.request_bytes += event.request_bytes
+        self.response_bytes += event.response_bytes
+
+    def as_dict(self):
+        return {
+            'method': self.method,
+            'endpoint': self.endpoint,
+            'count': self.latency.count,
+            'total_time': self.latency.total,
+            'mean': self.latency.mean,
+            'p50': self.latency.percentile(50),
+            'p95': self.latency.percentile(95),
+            'p99': self.latency.percentile(99),
+            'max': self.latency.max,
+            'ttfb_mean': self.ttfb.mean,
+            'statuses': dict(self.statuses),
+            'retries': self.retries,
+            'errors': self.errors,
+            'cache_hits': self.cache_hits,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes
+        }
+
+
+class MetricsCollector:
+    """In-process aggregator usable as an instrumentation hook.
+
+    Usage::
+
+        metrics = MetricsCollector()
+        client = EducationAPI("faesa", username, password, instrumentation=[metrics])
+        ...
+        print(metrics.report())
+    """
+
+    def __init__(self):
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        key = (event.method, event.endpoint)
+        with self._lock:
+            metrics = self.endpoints.get(key)
+            if metrics is None:
+                metrics = self.endpoints[key] = EndpointMetrics(*key)
+            metrics.record(event)
+
+    def summary(self):
+        """Per-endpoint metrics, the endpoints taking the most time first."""
+        with self._lock:
+            rows = [metrics.as_dict() for metrics in self.endpoints.values()]
+        return sorted(rows, key=lambda row: row['total_time'], reverse=True)
+
+    def report(self):
+        lines = [
+            f"{'endpoint':<70} {'n':>5} {'total':>8} {'p50':>7} {'p95':>7} "
+            f"{'p99':>7} {'retry':>5} {'err':>4} {'KiB in':>8}  status"
+        ]
+        for row in self.summary():
+            statuses = ', '.join(f"{status}: {count}" for status, count in row['statuses'].items())
+            lines.append(
+                f"{row['method'] + ' ' + row['endpoint']:<70} {row['count']:>5} "
+                f"{row['total_time']:>7.2f}s {row['p50']:>6.3f}s {row['p95']:>6.3f}s "
+                f"{row['p99']:>6.3f}s {row['retries']:>5} {row['errors']:>4} "
+                f"{row['response_bytes'] / 1024:>8.1f}  {statuses}"
+            )
+        return '\n'.join(lines)
+
+    def reset(self):
+        with self._lock:
+            self.endpoints = {}
+
+
+def emit(hooks, event):
+    """Deliver ``event`` to every hook; a failing hook never breaks the request."""
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception as e:
+            logging.exception(f"Instrumentation hook failed: {e}")
@@ -1,22 +1,36 @@
 import ssl
+import time
+import weakref
 import logging
+import threading
+from types import MappingProxyType
 from requests import Session
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - [%(levelname)s] - %(message)s"
+from requests.exceptions import ConnectionError, Timeout
+from eadconnect.http.cassette import CassetteMiss
+from eadconnect.http.retry import (
+    CircuitOpenError,
+    RetryManager
 )
-
-retry_strategy = Retry(
-    total=5,
-    backoff_factor=1,
-    status_forcelist=[429, 500, 502, 503, 504, 104],
-    allowed_methods=["HEAD", "POST", "PUT", "GET", "OPTIONS"]
+from eadconnect.http.instrumentation import (
+    RequestEvent,
+    emit
 )
 
+# urllib3 never retries: every attempt, connection errors included, goes
+# through `Browser.retry`, so it counts against the retry budget and the
+# circuit breaker. ``read=False`` keeps read timeouts as `Timeout`, like
+# the requests default.
+retry_strategy = Retry(0, read=False)
+
+# Connections kept per host; requests' default of 10 makes parallel
+# extraction wait on the pool.
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+
+DEFAULT_CIPHER_SUITE = 'ECDHE-ECDSA-AES128-GCM-SHA256'
+
 CIPHER_SUITE_FIREFOX = [
     "TLS_AES_128_GCM_SHA256",
     "TLS_CHACHA20_POLY1305_SHA256",
@@ -40,6 +54,137 @@ CIPHER_SUITE_FIREFOX = [
 ]
 
 
+class TLSSessionCache:
+    """Latest TLS session per host, offered again on the next handshake.
+
+    A resumed handshake skips the certificate exchange and key agreement,
+    so every connection after the first one to a host is cheaper. With TLS
+    1.3 the ticket only arrives after the handshake, so the session is read
+    from the last connection to the host when the next one is opened:
+    sockets are held weakly and save their session when closed, the
+    ``SSLObject`` of the async transport (which has no close hook) is kept
+    until the next handshake replaces it. Sessions live in memory only:
+    ``ssl.SSLSession`` cannot be serialized, so each new process pays one
+    full handshake per host, best paid early with `Browser.prewarm`.
+    """
+
+    def __init__(self):
+        self.handshakes = 0
+        self.resumed = 0
+        self._sessions = {}
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    def save(self, hostname, connection):
+        session = getattr(connection, 'session', None)
+        if session is not None and session.has_ticket:
+            with self._lock:
+                self._sessions[hostname] = session
+
+    def get(self, hostname):
+        last = self._connections.get(hostname)
+        connection = last() if isinstance(last, weakref.ref) else last
+        if connection is not None:
+            self.save(hostname, connection)
+        with self._lock:
+            session = self._sessions.get(hostname)
+            if session is not None and session.time + session.timeout < time.time():
+                del self._sessions[hostname]
+                session = None
+            return session
+
+    def track(self, hostname, connection):
+        """Count a finished handshake and remember its connection."""
+        with self._lock:
+            self.handshakes += 1
+            if getattr(connection, 'session_reused', False):
+                self.resumed += 1
+            if isinstance(connection, ssl.SSLSocket):
+                connection = weakref.ref(connection)
+            self._connections[hostname] = connection
+
+
+class SessionSavingSSLSocket(ssl.SSLSocket):
+    """Hands its TLS session to the context's `TLSSessionCache` before closing."""
+
+    def _real_close(self):
+        cache = getattr(self.context, 'session_cache', None)
+        if cache is not None and self.server_hostname and not self.server_side:
+            try:
+                cache.save(self.server_hostname, self)
+            except (OSError, ValueError):
+                pass
+        super()._real_close()
+
+
+class SessionTrackingSSLObject(ssl.SSLObject):
+    """`SSLObject` reporting its finished handshake to the `TLSSessionCache`.
+
+    httpx's async transport drives TLS through ``SSLContext.wrap_bio``, where
+    the handshake completes on a later `do_handshake` call, not on wrapping.
+    """
+
+    def do_handshake(self):
+        super().do_handshake()
+        cache = getattr(self.context, 'session_cache', None)
+        if cache is not None and self.server_hostname and not self.server_side:
+            cache.track(self.server_hostname, self)
+
+
+def create_ssl_context(cipher_suite, ecdh_curve='prime256v1', server_hostname=None):
+    """Build the TLS context shared by the sync and async transports.
+
+    Sockets (requests/urllib3, `HTTP2Adapter`) and memory BIOs (the httpx
+    async transport) get the same ``server_hostname`` override and TLS
+    session resumption.
+    """
+    ssl_context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    ssl_context.orig_wrap_socket = ssl_context.wrap_socket
+    ssl_context.orig_wrap_bio = ssl_context.wrap_bio
+    ssl_context.session_cache = TLSSessionCache()
+    ssl_context.sslsocket_class = SessionSavingSSLSocket
+    ssl_context.sslobject_class = SessionTrackingSSLObject
+
+    def prepare(kwargs):
+        if hasattr(ssl_context, 'server_hostname') and ssl_context.server_hostname:
+            kwargs['server_hostname'] = ssl_context.server_hostname
+            ssl_context.check_hostname = False
+        else:
+            ssl_context.check_hostname = True
+
+        hostname = kwargs.get('server_hostname')
+        if isinstance(hostname, bytes):
+            # httpcore passes the host as bytes; the connections report it as str.
+            hostname = hostname.decode('ascii')
+        if hostname and kwargs.get('session') is None:
+            kwargs['session'] = ssl_context.session_cache.get(hostname)
+        return hostname
+
+    def wrap_socket(*args, **kwargs):
+        hostname = prepare(kwargs)
+        sock = ssl_context.orig_wrap_socket(*args, **kwargs)
+        if hostname:
+            ssl_context.session_cache.track(hostname, sock)
+        return sock
+
+    def wrap_bio(*args, **kwargs):
+        # The handshake has not happened yet; SessionTrackingSSLObject tracks it.
+        prepare(kwargs)
+        return ssl_context.orig_wrap_bio(*args, **kwargs)
+
+    ssl_context.wrap_socket = wrap_socket
+    ssl_context.wrap_bio = wrap_bio
+
+    if server_hostname:
+        ssl_context.server_hostname = server_hostname
+
+    ssl_context.set_ciphers(cipher_suite)
+    ssl_context.set_ecdh_curve(ecdh_curve)
+    ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+    ssl_context.maximum_version = ssl.TLSVersion.TLSv1_3
+    return ssl_context
+
+
 class CipherSuiteAdapter(HTTPAdapter):
     __attrs__ = [
         'ssl_context',
@@ -68,28 +213,16 @@ class CipherSuiteAdapter(HTTPAdapter):
                 )
 
         if not self.ssl_context:
-            self.ssl_context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-            self.ssl_context.orig_wrap_socket = self.ssl_context.wrap_socket
-            self.ssl_context.wrap_socket = self.wrap_socket
-
-            if self.server_hostname:
-                self.ssl_context.server_hostname = self.server_hostname
-
-            self.ssl_context.set_ciphers(self.cipherSuite)
-            self.ssl_context.set_ecdh_curve(self.ecdhCurve)
-            self.ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
-            self.ssl_context.maximum_version = ssl.TLSVersion.TLSv1_3
+            self.ssl_context = create_ssl_context(
+                self.cipherSuite,
+                self.ecdhCurve,
+                self.server_hostname
+            )
 
         super(CipherSuiteAdapter, self).__init__(**kwargs)
 
     def wrap_socket(self, *args, **kwargs):
-        if hasattr(self.ssl_context, 'server_hostname') and self.ssl_context.server_hostname:
-            kwargs['server_hostname'] = self.ssl_context.server_hostname
-            self.ssl_context.check_hostname = False
-        else:
-            self.ssl_context.check_hostname = True
-
-        return self.ssl_context.orig_wrap_socket(*args, **kwargs)
+        return self.ssl_context.wrap_socket(*args, **kwargs)
 
     def init_poolmanager(self, *args, **kwargs):
         kwargs['ssl_context'] = self.ssl_context
@@ -105,57 +238,230 @@ class CipherSuiteAdapter(HTTPAdapter):
 class Browser(Session):
     def __init__(self, *args, **kwargs):
         super(Browser, self).__init__()
-        self.response = None
-        self.headers = self.get_headers()
+        self.set_headers()
         self.ecdhCurve = kwargs.pop('ecdhCurve', 'prime256v1')
-        self.cipherSuite = kwargs.pop('cipherSuite', 'ECDHE-ECDSA-AES128-GCM-SHA256')
+        self.cipherSuite = kwargs.pop('cipherSuite', DEFAULT_CIPHER_SUITE)
         self.source_address = kwargs.pop('source_address', None)
         self.server_hostname = kwargs.pop('server_hostname', None)
         self.ssl_context = kwargs.pop('ssl_context', None)
+        self.cache = kwargs.pop('cache', None)
+        self.rate_limiter = kwargs.pop('rate_limiter', None)
+        self.instrumentation = list(kwargs.pop('instrumentation', []))
+        self.cassette = kwargs.pop('cassette', None)
+        self.retry = kwargs.pop('retry', None) or RetryManager()
+        self.concurrency_limiter = kwargs.pop('concurrency_limiter', None)
+        self.pool_connections = kwargs.pop('pool_connections', DEFAULT_POOL_CONNECTIONS)
+        self.pool_maxsize = kwargs.pop('pool_maxsize', DEFAULT_POOL_MAXSIZE)
+        self.pool_block = kwargs.pop('pool_block', False)
+        self.keep_alive = kwargs.pop('keep_alive', True)
+        self.http2 = kwargs.pop('http2', False)
+
+        self.adapter = kwargs.pop('adapter', None) or self.create_adapter()
+        self.mount('https://', self.adapter)
+
+    def create_adapter(self):
+        """Build the HTTPS adapter from the TLS and connection pool settings."""
+        if self.http2:
+            from eadconnect.http.http2 import HTTP2Adapter
 
-        self.mount(
-            'https://',
-            CipherSuiteAdapter(
-                ecdhCurve=self.ecdhCurve,
-                cipherSuite=self.cipherSuite,
-                server_hostname=self.server_hostname,
-                source_address=self.source_address,
-                ssl_context=self.ssl_context,
-                max_retries=retry_strategy
+            if not self.ssl_context:
+                self.ssl_context = create_ssl_context(
+                    self.cipherSuite,
+                    self.ecdhCurve,
+                    self.server_hostname
+                )
+            return HTTP2Adapter(
+                self.ssl_context,
+                pool_maxsize=self.pool_maxsize,
+                pool_block=self.pool_block,
+                keep_alive=self.keep_alive,
+                source_address=self.source_address
             )
+
+        return CipherSuiteAdapter(
+            ecdhCurve=self.ecdhCurve,
+            cipherSuite=self.cipherSuite,
+            server_hostname=self.server_hostname,
+            source_address=self.source_address,
+            ssl_context=self.ssl_context,
+            max_retries=retry_strategy,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
         )
 
     def set_headers(self, headers=None):
-        self.headers = {
+        """Replace the base headers shared by every request.
+
+        The base is read-only so concurrent calls can never leak their
+        per-request headers (token, Referer) into each other; anything
+        call-specific goes through the ``headers`` argument of `send_request`.
+        """
+        base_headers = {
             "User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/119.0",
             "X-User-Timezone": "America/Sao_Paulo"
         }
         if headers:
             for key, value in headers.items():
-                self.headers[key] = value
+                base_headers[key] = value
+
+        self.headers = MappingProxyType(base_headers)
 
-    def get_headers(self):
-        return self.headers
+    def get_headers(self, headers=None):
+        """Return the base headers merged with the per-call ``headers``."""
+        merged = dict(self.headers)
+        if not self.keep_alive:
+            merged['Connection'] = 'close'
+        if headers:
+            merged.update(headers)
+
+        return merged
+
+    @staticmethod
+    def get_soup(response):
+        from bs4 import BeautifulSoup
 
-    def get_soup(self):
         return BeautifulSoup(
-            self.response.content,
+            response.content,
             "html.parser"
         )
 
-    def send_request(self, method, url, **kwargs):
-        logging.info(f"Sending {method} request to: {url}")
+    def add_instrumentation(self, hook):
+        """Register ``hook(event)`` to receive a `RequestEvent` per request."""
+        self.instrumentation.append(hook)
+
+    def prewarm(self, url, connections: int = 1, wait: bool = False):
+        """Open ``connections`` pooled connections to ``url`` in the background.
+
+        A first ``HEAD`` pays the full TLS handshake and leaves its session in
+        the cache; the other connections are then opened in parallel and
+        resume it. Failures are only logged: the real requests will retry.
+        Returns the warming thread (joined first when ``wait`` is true).
+        """
+        def warm():
+            try:
+                self.request('HEAD', url, headers=self.get_headers(), timeout=10, allow_redirects=False)
+            except Exception as e:
+                logging.debug(f"Could not prewarm {url}: {e}")
+
+        def run():
+            warm()
+            threads = [threading.Thread(target=warm, daemon=True) for _ in range(connections - 1)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        thread = threading.Thread(target=run, name="prewarm", daemon=True)
+        thread.start()
+        if wait:
+            thread.join()
+        return thread
+
+    def send_request(self, method, url, headers=None, **kwargs):
+        started = time.perf_counter()
+        response = error = None
         try:
-            self.response = self.request(
-                method,
-                url,
-                headers=self.headers,
-                **kwargs
-            )
-            if not self.response.ok:
-                logging.error(f"Request failed with status code: {self.response.status_code}")
-            logging.info(f"Request succeeded with status code: {self.response.status_code}")
-            return self.response
+            response = self._send_request(method, url, headers, **kwargs)
+            return response
+        except CircuitOpenError as e:
+            logging.warning(str(e))
+            response = e.to_response(url)
+            return response
+        except CassetteMiss as e:
+            # A replay that strays from the recording must fail loudly.
+            error = e
+            raise
         except Exception as e:
+            error = e
             logging.exception(f"An error occurred while making a request: {e}")
-            return self.response
+            return None
+        finally:
+            if self.instrumentation:
+                emit(
+                    self.instrumentation,
+                    RequestEvent.from_response(
+                        method,
+                        url,
+                        time.perf_counter() - started,
+                        response,
+                        error
+                    )
+                )
+
+    def close(self):
+        super(Browser, self).close()
+        if self.cassette:
+            self.cassette.close()
+
+    def _send_request(self, method, url, headers=None, **kwargs):
+        if self.cassette and self.cassette.replaying:
+            return self.cassette.play(method, url, **kwargs)
+
+        headers = self.get_headers(headers)
+        cache_key = entry = None
+        ttl = self.cache.ttl_for(url) if self.cache and method.upper() == 'GET' else 0
+        if ttl:
+            cache_key = self.cache.make_key(method, url, kwargs.get('params'), headers)
+            entry = self.cache.get(cache_key)
+            if entry and entry.is_fresh:
+                logging.info(f"Serving {method} {url} from cache")
+                return entry.to_response()
+            if entry:
+                headers.update(entry.validators())
+
+        response = self._request_with_retries(method, url, headers, **kwargs)
+        if cache_key:
+            if response.status_code == 304 and entry:
+                self.cache.refresh(cache_key, ttl)
+                return entry.to_response()
+            if response.ok:
+                self.cache.set(cache_key, response, ttl)
+
+        if self.cassette:
+            self.cassette.record(method, url, response, **kwargs)
+
+        if not response.ok:
+            logging.error(f"Request failed with status code: {response.status_code}")
+        else:
+            logging.info(f"Request succeeded with status code: {response.status_code}")
+        return response
+
+    def _request_with_retries(self, method, url, headers, **kwargs):
+        call = self.retry.call(method, url)
+        while call.proceed():
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+
+            logging.info(f"Sending {method} request to: {url}")
+            try:
+                response = self._send_once(method, url, headers, **kwargs)
+            except (ConnectionError, Timeout) as e:
+                delay = call.failed(e)
+                if delay is None:
+                    raise
+            except BaseException as e:
+                call.aborted(e)
+                raise
+            else:
+                delay = call.received(response)
+                if delay is None:
+                    break
+
+            time.sleep(delay)
+        return call.response
+
+    def _send_once(self, method, url, headers, **kwargs):
+        if not self.concurrency_limiter:
+            return self.request(method, url, headers=headers, **kwargs)
+
+        started = self.concurrency_limiter.acquire()
+        response = error = None
+        try:
+            response = self.request(method, url, headers=headers, **kwargs)
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.concurrency_limiter.release(started, getattr(response, 'status_code', None), error)
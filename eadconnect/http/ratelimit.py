@@ -0,0 +1,75 @@
+import time
+import asyncio
+import threading
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``burst``.
+
+    A call to `reserve` always takes a token, letting the bucket go into
+    debt, and returns how long the caller has to wait for it. Waiting
+    outside the lock keeps the bucket usable from threads and coroutines
+    alike while still handing out tokens in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be greater than zero")
+
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Per-host token buckets shared by every client using this limiter.
+
+    ``rate`` and ``burst`` apply to any host without an entry in
+    ``per_host``, which maps a host name to its own ``(rate, burst)``.
+    """
+
+    def __init__(self, rate: float = 2.0, burst: int = 4, per_host: dict = None):
+        self.rate = rate
+        self.burst = burst
+        self.per_host = per_host or {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url):
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.per_host.get(host, (self.rate, self.burst))
+                bucket = self._buckets[host] = TokenBucket(rate, burst)
+            return bucket
+
+    def acquire(self, url):
+        self.bucket_for(url).acquire()
+
+    async def acquire_async(self, url):
+        await self.bucket_for(url).acquire_async()
+
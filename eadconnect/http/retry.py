@@ -0,0 +1,363 @@
+import re
+import time
+import random
+import logging
+import threading
+from collections import deque
+from email.utils import parsedate_to_datetime
+from eadconnect.http.cache import build_response
+from eadconnect.http.instrumentation import endpoint_template
+
+# Methods retried unless a policy says otherwise: the ones that cannot have
+# side effects, so repeating them after a failure is always safe.
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to an endpoint that is failing."""
+
+    def __init__(self, endpoint, retry_in):
+        super().__init__(f"Circuit open for {endpoint}; retry in {retry_in:.1f}s")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+    @property
+    def headers(self):
+        return {'Retry-After': str(int(self.retry_in + 0.999))}
+
+    def to_response(self, url):
+        """A local 503 response, so callers handle it like any failed request."""
+        response = build_response(503, self.headers, b'', url, 'Circuit Open')
+        response.from_circuit_breaker = True
+        return response
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class RetryPolicy:
+    """How one kind of request is retried.
+
+    ``methods`` are retried on ``statuses`` and on connection errors,
+    waiting ``backoff_factor * 2 ** attempt`` seconds with full jitter
+    (capped at ``max_backoff``), or what the server asked in ``Retry-After``
+    when it is no longer than ``max_retry_after``; a longer hint means the
+    server will not recover soon, so the response is returned instead.
+    """
+
+    def __init__(
+            self,
+            total: int = 3,
+            backoff_factor: float = 0.5,
+            max_backoff: float = 10.0,
+            statuses=RETRY_STATUSES,
+            methods=IDEMPOTENT_METHODS,
+            respect_retry_after: bool = True,
+            max_retry_after: float = 30.0
+    ):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def delay(self, method, attempt, status_code=None, headers=None):
+        """Seconds to wait before retrying, or None when it must not be retried."""
+        if attempt >= self.total or method.upper() not in self.methods:
+            return None
+        if status_code is not None and status_code not in self.statuses:
+            return None
+
+        if self.respect_retry_after and headers is not None:
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+
+
+NO_RETRY = RetryPolicy(total=0)
+
+# Per-endpoint overrides, first match on the URL path wins.
+DEFAULT_POLICIES = {
+    r'/financial/payment/charges': NO_RETRY,
+}
+
+
+class RetryBudget:
+    """Client-wide cap on retries: at most ``ratio`` of the recent requests.
+
+    Requests and retries of the last ``window`` seconds are counted; a retry
+    is allowed while retries stay under ``max(min_retries, ratio * requests)``.
+    During an outage this turns retries off quickly instead of multiplying
+    the load on a server that is already struggling.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 3, window: float = 10.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self.exhausted = 0
+        self._requests = deque()
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    def _prune(self, now):
+        for events in (self._requests, self._retries):
+            while events and now - events[0] > self.window:
+                events.popleft()
+
+    def record_request(self):
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._requests.append(now)
+
+    def withdraw(self):
+        """Take one retry from the budget; False when it is spent."""
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            if len(self._retries) >= max(self.min_retries, self.ratio * len(self._requests)):
+                self.exhausted += 1
+                return False
+            self._retries.append(now)
+            return True
+
+
+class _Circuit:
+    __slots__ = ('state', 'failures', 'opened_at', 'probing')
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+
+
+class CircuitBreaker:
+    """Fails fast on endpoints that keep failing.
+
+    After ``failure_threshold`` consecutive failures (5xx or connection
+    errors) of one endpoint its circuit opens and requests raise
+    `CircuitOpenError` without touching the network. After
+    ``recovery_timeout`` seconds one probe request is let through: success
+    closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def state(self, endpoint):
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            return circuit.state if circuit else CLOSED
+
+    def allow(self, endpoint):
+        """Raise `CircuitOpenError` unless a request to ``endpoint`` may be sent."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.state == CLOSED:
+                return
+            retry_in = circuit.opened_at + self.recovery_timeout - time.monotonic()
+            if circuit.state == OPEN and retry_in <= 0:
+                circuit.state = HALF_OPEN
+            if circuit.state == HALF_OPEN and not circuit.probing:
+                circuit.probing = True
+                return
+        raise CircuitOpenError(endpoint, max(0.0, retry_in))
+
+    def record_success(self, endpoint):
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit:
+                circuit.state = CLOSED
+                circuit.failures = 0
+                circuit.probing = False
+
+    def release(self, endpoint):
+        """End a probe that got no answer, so the next request probes again."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit:
+                circuit.probing = False
+
+    def record_failure(self, endpoint):
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            circuit.failures += 1
+            circuit.probing = False
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+
+
+class RetryManager:
+    """Retry decisions of one client: policies, retry budget and circuit breaker.
+
+    ``policies`` maps URL path patterns to `RetryPolicy` objects (see
+    `DEFAULT_POLICIES`); other requests follow ``default``. Pass
+    ``budget=None`` or ``breaker=None`` to disable either.
+    """
+
+    def __init__(
+            self,
+            default: RetryPolicy = None,
+            policies=None,
+            budget=RetryBudget,
+            breaker=CircuitBreaker
+    ):
+        self.default = default or RetryPolicy()
+        self.policies = [
+            (re.compile(pattern), policy)
+            for pattern, policy in (DEFAULT_POLICIES if policies is None else policies).items()
+        ]
+        self.budget = budget() if isinstance(budget, type) else budget
+        self.breaker = breaker() if isinstance(breaker, type) else breaker
+
+    def policy_for(self, url):
+        path = url.split('?', 1)[0]
+        for pattern, policy in self.policies:
+            if pattern.search(path):
+                return policy
+        return self.default
+
+    @staticmethod
+    def endpoint(url):
+        return endpoint_template(url)
+
+    def before_request(self, endpoint):
+        """Check the circuit and count the request; may raise `CircuitOpenError`."""
+        if self.breaker:
+            self.breaker.allow(endpoint)
+        if self.budget:
+            self.budget.record_request()
+
+    def record(self, endpoint, status_code=None, error=None):
+        if not self.breaker:
+            return
+        if error is not None or (status_code is not None and status_code >= 500):
+            self.breaker.record_failure(endpoint)
+        else:
+            self.breaker.record_success(endpoint)
+
+    def backoff(self, policy, method, attempt, status_code=None, headers=None):
+        """Seconds to wait before the next attempt, or None to stop retrying."""
+        delay = policy.delay(method, attempt, status_code, headers)
+        if delay is None:
+            return None
+        if self.budget and not self.budget.withdraw():
+            return None
+        return delay
+
+    def call(self, method, url):
+        """Start the attempts of one request (see `RetryCall`)."""
+        return RetryCall(self, method, url)
+
+
+class RetryCall:
+    """Retry state of one request, shared by `Browser` and `AsyncBrowser`.
+
+    The transport only sends and sleeps; every decision is taken here::
+
+        call = manager.call(method, url)
+        while call.proceed():
+            try:
+                response = send()
+            except TransportError as e:
+                delay = call.failed(e)
+                if delay is None:
+                    raise
+            except BaseException as e:
+                call.aborted(e)
+                raise
+            else:
+                delay = call.received(response)
+                if delay is None:
+                    break
+            sleep(delay)
+        return call.response
+    """
+
+    def __init__(self, manager, method, url):
+        self.manager = manager
+        self.method = method
+        self.url = url
+        self.policy = manager.policy_for(url)
+        self.endpoint = manager.endpoint(url)
+        self.attempt = 0
+        self.response = None
+
+    def proceed(self):
+        """True when the next attempt may be sent.
+
+        An open circuit raises `CircuitOpenError` before the first attempt;
+        after that it only ends the retries and the last response is kept.
+        """
+        try:
+            self.manager.before_request(self.endpoint)
+        except CircuitOpenError:
+            if self.response is None:
+                raise
+            return False
+        return True
+
+    def received(self, response):
+        """Record a response; seconds to wait before retrying it, or None."""
+        self.response = response
+        response.retry_count = self.attempt
+        self.manager.record(self.endpoint, response.status_code)
+        delay = self.manager.backoff(
+            self.policy,
+            self.method,
+            self.attempt,
+            response.status_code,
+            response.headers
+        )
+        if delay is not None:
+            logging.warning(
+                f"Status {response.status_code}; retrying {self.method} {self.url} in {delay:.1f}s"
+            )
+            self.attempt += 1
+        return delay
+
+    def failed(self, error):
+        """Record a connection error; seconds to wait before retrying, or None."""
+        self.manager.record(self.endpoint, error=error)
+        delay = self.manager.backoff(self.policy, self.method, self.attempt)
+        if delay is not None:
+            logging.warning(f"{error!r}; retrying {self.method} {self.url} in {delay:.1f}s")
+            self.attempt += 1
+        return delay
+
+    def aborted(self, error):
+        """Record an attempt ended by an error that is not retried.
+
+        Errors count as failures; a cancellation or interrupt only frees
+        the half-open probe. Either way the circuit is not left waiting for
+        an answer that will never come.
+        """
+        if isinstance(error, Exception):
+            self.manager.record(self.endpoint, error=error)
+        elif self.manager.breaker:
+            self.manager.breaker.release(self.endpoint)
@@ -1,7 +1,6 @@
 import logging
 from eadconnect.client import EducationAPI
-
-logging.basicConfig(level=logging.INFO)
+from eadconnect.utils.history import final_grade_value
 
 
 class AcademicService:
@@ -70,8 +69,52 @@ class AcademicService:
 
         return grades
 
-    def detect_grade_changes(self, current_grades: dict, previous_grades: dict):
-        """Detect changes in grades between current and previous grades."""
+    def get_grades_by_course_id(self, courses: list):
+        """Retrieve ``{course_id: (course_name, final_grade_value)}`` for each course.
+
+        The values are the ones `GradeMonitor` stores, so both can share a
+        `GradeHistory`. Courses whose request failed are left out, so a
+        transient error is never recorded as a grade change.
+        """
+        grades = {}
+        for course in courses:
+            response = self.client.get_grades(course["id"])
+            if not isinstance(response, dict):
+                logging.warning(
+                    f"Could not fetch the grades of course ID {course['id']}: "
+                    f"status {getattr(response, 'status_code', None)}"
+                )
+                continue
+            grades[course["id"]] = (course.get("name"), final_grade_value(response))
+
+        return grades
+
+    def detect_grade_changes(
+            self,
+            current_grades: dict,
+            previous_grades: dict = None,
+            history: 'GradeHistory' = None,
+            account: str = None
+    ):
+        """Detect changes in grades between current and previous grades.
+
+        With a ``history`` store, ``current_grades`` is the output of
+        `get_grades_by_course_id`: the previous grades are read from the store
+        instead of ``previous_grades`` and only the changed ones are written
+        back, under ``account`` (the client's username by default).
+        """
+        if history is not None:
+            changes = history.record(account or self.client.username, current_grades)
+            return {
+                change.course_id: {
+                    "course_name": change.course_name,
+                    "before": change.before,
+                    "now": change.now
+                }
+                for change in changes
+            }
+
+        previous_grades = previous_grades or {}
         changes = {}
         for name, current_grade in current_grades.items():
             previous_grade = previous_grades.get(name)
@@ -95,6 +138,13 @@ class AcademicService:
             conversation.get('messages', [])[0] for conversation in conversations
         ]
 
+    def iter_messages(self, items_per_page: int = 15, prefetch: bool = True):
+        """Iterate over the latest message of every conversation, across all pages."""
+        for conversation in self.client.iter_messages(items_per_page, prefetch=prefetch):
+            messages = conversation.get('messages', [])
+            if messages:
+                yield messages[0]
+
     def get_calendar(self, start_date: str = None, end_date: str = None):
         """Retrieve the calendar for the platform."""
         calendar = self.client.get_calendar(start_date, end_date)
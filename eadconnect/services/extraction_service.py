@@ -0,0 +1,313 @@
+import os
+import time
+import asyncio
+import inspect
+import logging
+import threading
+import multiprocessing
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from eadconnect.utils.file_manager import save_exercise_data
+from eadconnect.utils.manifest import ExportManifest
+
+logger = logging.getLogger(__name__)
+
+
+def list_exercise_topics(contents: dict):
+    """Return the exercise topics listed in the contents of a course."""
+    topics = contents.get('topics') or []
+    return [
+        {'id': child['id'], 'title': child['title']}
+        for child in topics[2]['children']
+    ]
+
+
+def build_exercise_payload(course: dict, topic: dict, data: dict):
+    """Shape the raw topic returned by the API into the exported payload."""
+    return {
+        'discipline': course['title'],
+        'title': topic['title'],
+        'content': data['topics'][4]['content']
+    }
+
+
+def write_exercise_payload(course: dict, topic: dict, payload: dict, manifest=None, render_pool=None):
+    """Persist one topic as JSON/PDF inside the course directory."""
+    return save_exercise_data(payload, course['course_name'], topic['id'], manifest, render_pool)
+
+
+def _accepts(function, name):
+    try:
+        parameters = inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in parameters or any(
+        parameter.kind == parameter.VAR_KEYWORD for parameter in parameters.values()
+    )
+
+
+class StageStats:
+    """Counters of one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.processed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        self.started_at = None
+        self.finished_at = None
+
+    def record(self, elapsed: float, ok: bool = True):
+        if self.started_at is None:
+            self.started_at = time.monotonic() - elapsed
+        self.finished_at = time.monotonic()
+        self.busy_time += elapsed
+        if ok:
+            self.processed += 1
+        else:
+            self.failed += 1
+
+    @property
+    def wall_time(self):
+        if self.started_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def throughput(self):
+        """Items completed per second of wall time."""
+        return self.processed / self.wall_time if self.wall_time else 0.0
+
+    def __repr__(self):
+        return (
+            f"{self.name}: {self.processed} ok, {self.failed} failed, "
+            f"{self.throughput:.2f} items/s, busy {self.busy_time:.2f}s"
+        )
+
+
+class ExtractionPipeline:
+    """Fetch → transform → write pipeline for the exercises of many courses.
+
+    Topics are fetched with at most ``fetch_concurrency`` requests in flight,
+    shaped by ``transform`` on the event loop and handed to ``writer`` on a
+    pool of ``write_workers`` threads. Stages are joined by queues holding at
+    most ``queue_size`` items, so a slow writer throttles the fetchers
+    instead of piling topics up in memory. A failing topic is logged and
+    recorded in `failures` without stopping the others.
+
+    ``writer(course, topic, payload)`` persists one topic; the optional
+    keywords it declares are filled in by the pipeline. With
+    ``skip_unchanged`` a ``manifest`` keyword receives the course's
+    `ExportManifest`, so topics whose content hash did not change are not
+    written again. A ``render_pool`` keyword receives a `PDFRenderPool` of
+    ``render_processes`` processes (one per CPU by default, ``0`` renders
+    in the writer threads). The default writer takes both. Writers run
+    concurrently even within a course, so they must serialize their own
+    shared files, as `save_exercise_data` does for the course archives.
+
+    By default there are two writer threads, or one per render process
+    plus one when a render pool is used, so every process has a PDF to
+    render while the other writers save JSON and update archives.
+
+    ``client`` may be an `EducationAPI` (its calls run in worker threads) or
+    an `AsyncEducationAPI`.
+    """
+
+    def __init__(
+            self,
+            client,
+            fetch_concurrency: int = 4,
+            write_workers: int = None,
+            queue_size: int = 8,
+            list_topics=list_exercise_topics,
+            transform=build_exercise_payload,
+            writer=write_exercise_payload,
+            skip_unchanged: bool = True,
+            render_processes: int = None
+    ):
+        self.client = client
+        self.fetch_concurrency = fetch_concurrency
+        self.write_workers = write_workers
+        self.queue_size = queue_size
+        self.list_topics = list_topics
+        self.transform = transform
+        self.writer = writer
+        self.skip_unchanged = skip_unchanged
+        self.render_processes = render_processes
+        self.render_pool = None
+        self.stats = {}
+        self.failures = []
+        self.manifests = {}
+        self._manifests_lock = threading.Lock()
+
+    async def _call(self, method, *args):
+        if inspect.iscoroutinefunction(method):
+            return await method(*args)
+        return await asyncio.to_thread(method, *args)
+
+    def _fail(self, stage, course, topic, error):
+        title = topic['title'] if topic else course['title']
+        logger.error(f"❌ {stage} falhou para '{title}': {error}")
+        self.failures.append({
+            'stage': stage,
+            'course': course,
+            'topic': topic,
+            'error': error
+        })
+
+    async def _produce(self, courses, topics_queue):
+        stats = self.stats['list']
+        for course in courses:
+            started = time.monotonic()
+            try:
+                contents = await self._call(self.client.get_contents, course['id'])
+                topics = self.list_topics(contents)
+            except Exception as e:
+                stats.record(time.monotonic() - started, ok=False)
+                self._fail('list', course, None, e)
+                continue
+
+            stats.record(time.monotonic() - started)
+            logger.info(f"📘 {course['title']}: {len(topics)} tópicos encontrados.")
+            for topic in topics:
+                await topics_queue.put((course, topic))
+
+    async def _fetch(self, topics_queue, fetched_queue):
+        stats = self.stats['fetch']
+        while True:
+            course, topic = await topics_queue.get()
+            started = time.monotonic()
+            try:
+                data = await self._call(self.client.get_exercises, course['id'], topic['id'])
+                if not isinstance(data, dict):
+                    raise ValueError(f"resposta inválida: {data}")
+            except Exception as e:
+                stats.record(time.monotonic() - started, ok=False)
+                self._fail('fetch', course, topic, e)
+            else:
+                stats.record(time.monotonic() - started)
+                await fetched_queue.put((course, topic, data))
+            finally:
+                topics_queue.task_done()
+
+    async def _transform(self, fetched_queue, write_queue):
+        stats = self.stats['transform']
+        while True:
+            course, topic, data = await fetched_queue.get()
+            started = time.monotonic()
+            try:
+                payload = self.transform(course, topic, data)
+            except Exception as e:
+                stats.record(time.monotonic() - started, ok=False)
+                self._fail('transform', course, topic, e)
+            else:
+                stats.record(time.monotonic() - started)
+                await write_queue.put((course, topic, payload))
+            finally:
+                fetched_queue.task_done()
+
+    def _write_course(self, course, topic, payload):
+        options = {}
+        if self.render_pool is not None:
+            options['render_pool'] = self.render_pool
+
+        if self.skip_unchanged and _accepts(self.writer, 'manifest'):
+            # Topics of one course share its manifest.
+            with self._manifests_lock:
+                manifest = self.manifests.get(course['id'])
+                if manifest is None:
+                    manifest = self.manifests[course['id']] = ExportManifest(course['course_name'])
+            options['manifest'] = manifest
+        return self.writer(course, topic, payload, **options)
+
+    def _renders_in_pool(self):
+        return self.render_processes != 0 and _accepts(self.writer, 'render_pool')
+
+    def _write_workers(self):
+        if self.write_workers:
+            return self.write_workers
+        if not self._renders_in_pool():
+            return 2
+        return (self.render_processes or os.cpu_count() or 1) + 1
+
+    def _render_pool(self):
+        if not self._renders_in_pool():
+            return nullcontext()
+
+        from eadconnect.utils.pdf import PDFRenderPool
+
+        # The writer threads are already running when the pool starts its
+        # processes, so they are spawned instead of forked.
+        return PDFRenderPool(self.render_processes, mp_context=multiprocessing.get_context('spawn'))
+
+    async def _write(self, write_queue, executor):
+        stats = self.stats['write']
+        loop = asyncio.get_running_loop()
+        while True:
+            course, topic, payload = await write_queue.get()
+            started = time.monotonic()
+            try:
+                status = await loop.run_in_executor(
+                    executor,
+                    self._write_course,
+                    course,
+                    topic,
+                    payload
+                )
+            except Exception as e:
+                stats.record(time.monotonic() - started, ok=False)
+                self._fail('write', course, topic, e)
+            else:
+                stats.record(time.monotonic() - started)
+                logger.info(f"💾 {topic['title']}: {status or 'salvo'}.")
+            finally:
+                write_queue.task_done()
+
+    async def run(self, courses):
+        """Run the pipeline over ``courses`` and return the per-stage stats.
+
+        Each course is a dict with ``id``, ``title`` and ``course_name``,
+        like the ones listed in ``main.py``.
+        """
+        self.stats = {name: StageStats(name) for name in ('list', 'fetch', 'transform', 'write')}
+        self.failures = []
+        self.manifests = {}
+        if self.skip_unchanged and not _accepts(self.writer, 'manifest'):
+            logger.warning("⚠️ O writer não recebe 'manifest'; todos os tópicos serão gravados.")
+        topics_queue = asyncio.Queue(self.queue_size)
+        fetched_queue = asyncio.Queue(self.queue_size)
+        write_queue = asyncio.Queue(self.queue_size)
+        write_workers = self._write_workers()
+
+        with self._render_pool() as self.render_pool, \
+                ThreadPoolExecutor(max_workers=write_workers) as executor:
+            workers = [
+                asyncio.create_task(self._fetch(topics_queue, fetched_queue))
+                for _ in range(self.fetch_concurrency)
+            ]
+            workers.append(asyncio.create_task(self._transform(fetched_queue, write_queue)))
+            workers.extend(
+                asyncio.create_task(self._write(write_queue, executor))
+                for _ in range(write_workers)
+            )
+            try:
+                await self._produce(courses, topics_queue)
+                for queue in (topics_queue, fetched_queue, write_queue):
+                    await queue.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                for manifest in self.manifests.values():
+                    manifest.save()
+        self.render_pool = None
+
+        return self.stats
+
+    def report(self):
+        """Human readable summary of the last run."""
+        lines = [repr(stats) for stats in self.stats.values()]
+        lines.extend(manifest.report() for manifest in self.manifests.values())
+        if self.failures:
+            lines.append(f"{len(self.failures)} falha(s)")
+        return '\n'.join(lines)
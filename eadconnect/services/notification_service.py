@@ -1,16 +1,157 @@
-import os
-import json
 import time
-import schedule
 import asyncio
 import logging
-from telethon import TelegramClient
-
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+from eadconnect.services.scheduler import AsyncScheduler
+from eadconnect.utils.history import (
+    GradeHistory,
+    final_grade_value
 )
+
 logger = logging.getLogger(__name__)
 
+TELEGRAM_MAX_LENGTH = 4096
+
+
+class Notification:
+    __slots__ = ('message', 'delete_after', 'attempts')
+
+    def __init__(self, message: str, delete_after: float = None):
+        self.message = message
+        self.delete_after = delete_after
+        self.attempts = 0
+
+
+class NotificationQueue:
+    """
+    Fila de saída das mensagens do Telegram, enviada por uma tarefa em
+    segundo plano.
+
+    `put` apenas enfileira e retorna na hora, então quem notifica nunca espera
+    pelo Telegram. Mensagens que se acumulam enquanto o envio anterior está
+    em andamento são unidas numa só (até o limite de tamanho do Telegram).
+    Um ``FloodWaitError`` pausa o envio pelo tempo pedido pelo servidor;
+    outras falhas são repetidas com backoff exponencial até ``max_attempts``.
+    Mensagens temporárias (``delete_after``) são apagadas por tarefas
+    próprias, sem segurar a fila.
+    """
+
+    def __init__(
+            self,
+            client: 'TelegramClient',
+            recipient,
+            max_attempts: int = 5,
+            backoff: float = 1.0,
+            max_backoff: float = 60.0
+    ):
+        self.client = client
+        self.recipient = recipient
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.sent = 0
+        self.dropped = 0
+        self._queue = None
+        self._sender = None
+        self._pending = None
+        self._deletions = set()
+
+    def start(self):
+        """Inicia a tarefa de envio; deve ser chamado com o loop rodando."""
+        if self._sender is None:
+            self._queue = asyncio.Queue()
+            self._sender = asyncio.create_task(self._send_loop(), name='telegram-sender')
+        return self
+
+    def put(self, message: str, delete_after: float = None):
+        """Enfileira uma mensagem; com ``delete_after`` ela é apagada depois desses segundos."""
+        if self._queue is None:
+            raise RuntimeError("NotificationQueue não foi iniciada")
+        self._queue.put_nowait(Notification(message, delete_after))
+
+    async def _next_batch(self):
+        """Próxima mensagem, unida às permanentes que já estão na fila."""
+        if self._pending is not None:
+            first, self._pending = self._pending, None
+        else:
+            first = await self._queue.get()
+        if first.delete_after is not None:
+            return first
+
+        parts = [first.message]
+        length = len(first.message)
+        while not self._queue.empty():
+            candidate = self._queue.get_nowait()
+            extra = len(candidate.message) + 2
+            if candidate.delete_after is not None or length + extra > TELEGRAM_MAX_LENGTH:
+                self._pending = candidate
+                break
+            self._queue.task_done()
+            parts.append(candidate.message)
+            length += extra
+        if len(parts) > 1:
+            return Notification("\n\n".join(parts))
+        return first
+
+    async def _send(self, notification: Notification):
+        from telethon.errors import FloodWaitError
+
+        while True:
+            notification.attempts += 1
+            try:
+                return await self.client.send_message(
+                    self.recipient,
+                    message=notification.message,
+                    parse_mode='markdown'
+                )
+            except FloodWaitError as e:
+                logger.info(f"⏳ Flood wait do Telegram: aguardando {e.seconds}s...")
+                await asyncio.sleep(e.seconds)
+            except Exception as e:
+                if notification.attempts >= self.max_attempts:
+                    raise
+                delay = min(self.max_backoff, self.backoff * 2 ** (notification.attempts - 1))
+                logger.info(f"⚠️ Falha ao enviar notificação ({e}); nova tentativa em {delay:.0f}s.")
+                await asyncio.sleep(delay)
+
+    async def _send_loop(self):
+        while True:
+            notification = await self._next_batch()
+            try:
+                message = await self._send(notification)
+                self.sent += 1
+                if notification.delete_after is not None and message is not None:
+                    task = asyncio.create_task(self._delete_later(message.id, notification.delete_after))
+                    self._deletions.add(task)
+                    task.add_done_callback(self._deletions.discard)
+            except Exception as e:
+                self.dropped += 1
+                logger.info(f"❌ Notificação descartada após {notification.attempts} tentativas: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _delete_later(self, message_id, delay: float):
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            try:
+                await self.client.delete_messages(self.recipient, [message_id])
+            except Exception as e:
+                logger.info(f"⚠️ Não foi possível apagar a mensagem temporária: {e}")
+
+    async def stop(self, timeout: float = 30):
+        """Envia o que estiver na fila (até ``timeout``) e apaga as mensagens temporárias."""
+        if self._sender is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.info(f"⚠️ {self._queue.qsize()} notificações não enviadas.")
+        self._sender.cancel()
+        for task in list(self._deletions):
+            task.cancel()
+        await asyncio.gather(self._sender, *self._deletions, return_exceptions=True)
+        self._sender = None
+
 
 class GradeMonitor:
     """
@@ -25,8 +166,11 @@ class GradeMonitor:
             api_hash: str,
             recipient: str,
             session_name: str = 'monitor_notas_session',
-            cache_file: str = 'cache_notas.json',
-            bot_token: str = None
+            history: GradeHistory = None,
+            account: str = None,
+            bot_token: str = None,
+            max_concurrency: int = 4,
+            jitter: float = 0.1
     ):
         """
         Inicializa o monitor de notas.
@@ -37,31 +181,65 @@ class GradeMonitor:
             api_hash (str): O seu API Hash do Telegram.
             recipient (str): O destino das mensagens ('me', '@username', ou ID do chat).
             session_name (str, optional): Nome do arquivo de sessão do Telethon.
-            cache_file (str, optional): Nome do arquivo para o cache de notas.
+            history (GradeHistory, optional): Histórico de notas (SQLite) usado para detectar mudanças.
+            account (str, optional): Conta no histórico; por padrão, o usuário da sessão.
             bot_token (str, optional): Token do bot do Telegram (se necessário).
+            max_concurrency (int, optional): Máximo de consultas de notas simultâneas.
+            jitter (float, optional): Variação aleatória do intervalo (fração dele).
         """
         self.ead_session = ead_session
         self.chat_recipient = recipient
-        self.arquivo_cache = cache_file
+        self.history = history or GradeHistory()
+        self.account = account or getattr(ead_session, 'username', None) or 'default'
         self.bot_token = bot_token
         self.check_interval = 2  # Intervalo de verificação em minutos
+        self.max_concurrency = max_concurrency
+        self.jitter = jitter
+        self.scheduler = AsyncScheduler()
+
+        # Inicializa o cliente Telethon (importado só quando o monitor é usado)
+        from telethon import TelegramClient
 
-        # Inicializa o cliente Telethon
         self.client = TelegramClient(session_name, api_id, api_hash)
+        self.notifications = NotificationQueue(self.client, recipient)
+
+    async def _buscar_nota(self, course, semaphore):
+        """
+        Busca a nota de uma disciplina numa thread, sem bloquear o loop.
 
-    def _buscar_notas_api(self):
+        Retorna None quando a requisição falha (``get_grades`` devolve a
+        ``Response``): a disciplina fica de fora desta verificação, em vez de
+        ser gravada como 'N/A' e notificada como mudança.
+        """
+        course_name = course.get('name', 'Disciplina Desconhecida').split(' (')[0]
+        async with semaphore:
+            my_grades = await asyncio.to_thread(self.ead_session.get_grades, course_id=course['id'])
+        if not isinstance(my_grades, dict):
+            status = getattr(my_grades, 'status_code', None)
+            logger.info(f"⚠️ Nota de '{course_name}' indisponível (status {status}); ignorada nesta verificação.")
+            return None
+        return {
+            "course_id": course['id'],
+            "disciplina": course_name,
+            "nota": final_grade_value(my_grades)
+        }
+
+    async def _buscar_notas_api(self):
         """
         Busca as notas mais recentes da API da faculdade.
-        Este é um método "privado" da classe.
+        As chamadas bloqueantes rodam em threads e as notas de todas as
+        disciplinas atuais são buscadas em paralelo.
         """
         logger.info("Buscando dados do perfil...")
         try:
-            profile = self.ead_session.get_me()
+            profile, my_courses = await asyncio.gather(
+                asyncio.to_thread(self.ead_session.get_me),
+                asyncio.to_thread(self.ead_session.get_my_courses)
+            )
             user = profile.get('user', {})
             logger.info(f"👤 Perfil: {user.get('name', 'N/A')} ({user.get('email', 'N/A')})")
             logger.info("🔄 Extraindo dados dos cursos...")
 
-            my_courses = self.ead_session.get_my_courses()
             actual_courses = [
                 course for course in my_courses.get('courses', []) if course.get('status') == 'isActual'
             ]
@@ -70,108 +248,59 @@ class GradeMonitor:
                 logger.info("Nenhum curso atual encontrado.")
                 return []
 
-            grades_actual_list = []
             logger.info("🔄 Extraindo dados das notas...")
-            for actual_course in actual_courses:
-                course_name = actual_course.get('name', 'Disciplina Desconhecida').split(' (')[0]
-                my_grades = self.ead_session.get_grades(course_id=actual_course['id'])
-                final_grade = my_grades.get('finalGrade', {})
-                grade_value = final_grade.get('value', 'N/A')
-
-                grade_dict = {
-                    "disciplina": course_name,
-                    "nota": grade_value
-                }
-                grades_actual_list.append(grade_dict)
-                time.sleep(2)  # Mantém o delay para não sobrecarregar a API
-
-            return grades_actual_list
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            notas = await asyncio.gather(
+                *(self._buscar_nota(course, semaphore) for course in actual_courses)
+            )
+            return [nota for nota in notas if nota is not None]
 
         except Exception as e:
             logger.info(f"❌ Erro ao buscar notas da API: {e}")
             return None
 
-    def _carregar_cache(self):
-        """Carrega as notas do cache local (arquivo JSON)."""
-        if not os.path.exists(self.arquivo_cache):
-            return {}
-        try:
-            with open(self.arquivo_cache, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            logger.info(f"⚠️ Erro ao carregar o cache: {e}")
-            return {}
-
-    def _salvar_cache(self, notas):
-        """Salva as notas mais recentes no cache local."""
-        try:
-            with open(self.arquivo_cache, 'w', encoding='utf-8') as f:
-                json.dump(notas, f, ensure_ascii=False, indent=4)
-        except IOError as e:
-            logger.info(f"❌ Erro ao salvar o cache: {e}")
-
-    async def _enviar_notificacao(self, disciplina, nota_antiga, nota_nova):
-        """Envia uma mensagem formatada para o Telegram."""
-        nota_antiga_str = str(nota_antiga) if nota_antiga is not None else "N/A"
-        mensagem = (
-            f"📢 **Nova nota disponível!** 📢\n\n"
-            f"📄 **Disciplina:** {disciplina}\n"
-            f"📊 **Nota Anterior:** `{nota_antiga_str}`\n"
-            f"✅ **Nova Nota:** `{nota_nova}`\n\n"
-            f"Boa sorte! 🍀"
-        )
-        try:
-            await self.client.send_message(
-                self.chat_recipient,
-                message=mensagem,
-                parse_mode='markdown'
+    @staticmethod
+    def _formatar_notificacao(mudancas):
+        """Monta uma única mensagem com todas as mudanças de uma verificação."""
+        blocos = []
+        for mudanca in mudancas:
+            nota_antiga_str = str(mudanca.before) if mudanca.before is not None else "N/A"
+            blocos.append(
+                f"📄 **Disciplina:** {mudanca.course_name}\n"
+                f"📊 **Nota Anterior:** `{nota_antiga_str}`\n"
+                f"✅ **Nova Nota:** `{mudanca.now}`"
             )
-            logger.info(f"✅ Notificação enviada para a disciplina: {disciplina}")
-        except Exception as e:
-            logger.info(f"❌ Falha ao enviar notificação: {e}")
+        titulo = "Nova nota disponível!" if len(mudancas) == 1 else "Novas notas disponíveis!"
+        return f"📢 **{titulo}** 📢\n\n" + "\n\n".join(blocos) + "\n\nBoa sorte! 🍀"
 
     async def _verificar_e_notificar(self):
-        """Compara notas atuais com o cache e notifica se houver mudança."""
+        """Compara notas atuais com o histórico e notifica se houver mudança."""
         logger.info(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Iniciando verificação de notas...")
 
-        notas_atuais_lista = self._buscar_notas_api()
+        notas_atuais_lista = await self._buscar_notas_api()
         if notas_atuais_lista is None:
             logger.info("Verificação abortada devido a erro na API.")
             return
 
-        notas_atuais_dict = {item['disciplina']: item['nota'] for item in notas_atuais_lista}
-        notas_cache = self._carregar_cache()
-
-        tasks_notificacao = []
-        houve_mudanca = False
-
-        for disciplina, nota_atual in notas_atuais_dict.items():
-            nota_cache = notas_cache.get(disciplina, 0)
-
-            if nota_cache != nota_atual:
-                logger.info(f"🔄 Mudança detectada em '{disciplina}': de '{nota_cache}' para '{nota_atual}'")
-                task = self._enviar_notificacao(disciplina, nota_cache, nota_atual)
-                tasks_notificacao.append(task)
-                houve_mudanca = True
-
-        if tasks_notificacao:
-            await asyncio.gather(*tasks_notificacao)
+        notas_atuais = {
+            item['course_id']: (item['disciplina'], item['nota'])
+            for item in notas_atuais_lista
+        }
+        # Grava apenas as notas que mudaram e devolve as mudanças
+        mudancas = await asyncio.to_thread(self.history.record, self.account, notas_atuais)
+
+        for mudanca in mudancas:
+            logger.info(
+                f"🔄 Mudança detectada em '{mudanca.course_name}': "
+                f"de '{mudanca.before}' para '{mudanca.now}'"
+            )
 
-        if houve_mudanca:
-            logger.info("💾 Atualizando o cache de notas...")
-            self._salvar_cache(notas_atuais_dict)
+        # Só enfileira: o envio e a remoção ficam com a tarefa da fila
+        if mudancas:
+            self.notifications.put(self._formatar_notificacao(mudancas))
         else:
             logger.info("👍 Nenhuma alteração nas notas.")
-            response_message = await self.client.send_message(
-                self.chat_recipient,
-                message="👍 Nenhuma alteração nas notas.",
-                parse_mode='markdown'
-            )
-            await asyncio.sleep(30)
-            await self.client.delete_messages(
-                self.chat_recipient,
-                [response_message.id]
-            )
+            self.notifications.put("👍 Nenhuma alteração nas notas.", delete_after=30)
 
     async def run(self):
         """
@@ -182,25 +311,26 @@ class GradeMonitor:
             logger.info(self.bot_token)
             await self.client.start(bot_token=self.bot_token)
             logger.info("✅ Cliente Telethon conectado. Monitor de notas iniciado.")
-
-            await self._verificar_e_notificar()
-
-            # Agenda a tarefa. O lambda garante que a corrotina seja agendada no loop de eventos
-            schedule.every(self.check_interval).minutes.do(
-                lambda: asyncio.create_task(self._verificar_e_notificar())
+            self.notifications.start()
+
+            # A primeira verificação roda logo; as seguintes nunca se sobrepõem
+            self.scheduler.every(
+                self.check_interval * 60,
+                self._verificar_e_notificar,
+                jitter=self.jitter,
+                name='verificar_notas'
             )
 
             logger.info(f"🗓️ Verificação agendada a cada {self.check_interval} minutos. Pressione Ctrl+C para sair.")
 
-            while True:
-                schedule.run_pending()
-                await asyncio.sleep(1)
+            await self.scheduler.run()
 
         except KeyboardInterrupt:
             logger.info("\n🛑 Monitor encerrado pelo usuário.")
         except Exception as e:
             logger.info(f"❌ Ocorreu um erro crítico: {e}")
         finally:
+            await self.notifications.stop()
             if self.client.is_connected():
                 logger.info("🔌 Desconectando o cliente Telethon...")
                 await self.client.disconnect()
@@ -209,6 +339,9 @@ class GradeMonitor:
 
 def start_monitor(ead_session, settings):
     """Função principal para configurar e rodar o monitor."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
 
     # Crie uma instância do monitor
     monitor = GradeMonitor(
@@ -0,0 +1,137 @@
+import time
+import random
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """A coroutine function run every ``interval`` seconds by `AsyncScheduler`.
+
+    ``jitter`` is the fraction of the interval by which each wait is randomly
+    lengthened or shortened, so several monitors started together do not hit
+    the API at the same instant. Runs never overlap: the next run is due an
+    interval after the current one started, but never starts before it has
+    finished, so a slow check delays the next one instead of stacking.
+    """
+
+    def __init__(
+            self,
+            func,
+            interval: float,
+            jitter: float = 0.1,
+            name: str = None,
+            run_immediately: bool = True,
+            timeout: float = None
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.name = name or getattr(func, '__name__', repr(func))
+        self.run_immediately = run_immediately
+        self.timeout = timeout
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.last_started = None
+        self.last_duration = None
+        self._running = asyncio.Lock()
+
+    @property
+    def running(self):
+        return self._running.locked()
+
+    def next_delay(self, started: float = None):
+        """Seconds to wait before the next run, given when the last one started."""
+        delay = self.interval
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        if started is not None:
+            delay -= time.monotonic() - started
+        return max(0.0, delay)
+
+    async def run_once(self):
+        """Run the job now unless a previous run is still in progress."""
+        if self.running:
+            self.skipped += 1
+            logger.warning(f"Job '{self.name}' still running; skipping this run.")
+            return False
+
+        async with self._running:
+            self.last_started = time.monotonic()
+            self.runs += 1
+            try:
+                if self.timeout:
+                    await asyncio.wait_for(self.func(), self.timeout)
+                else:
+                    await self.func()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                logger.exception(f"Job '{self.name}' failed: {e}")
+            finally:
+                self.last_duration = time.monotonic() - self.last_started
+        return True
+
+
+class AsyncScheduler:
+    """Runs `PeriodicJob`s as tasks of the current event loop.
+
+    Each job sleeps until its next run instead of polling, so an idle
+    scheduler costs nothing. Jobs must be coroutine functions; blocking work
+    belongs in ``asyncio.to_thread`` inside them.
+
+    Usage::
+
+        scheduler = AsyncScheduler()
+        scheduler.every(120, monitor.check, jitter=0.1)
+        await scheduler.run()
+    """
+
+    def __init__(self):
+        self.jobs = []
+        self._tasks = []
+
+    def every(self, interval: float, func, **kwargs) -> PeriodicJob:
+        """Register ``func`` to run every ``interval`` seconds."""
+        job = PeriodicJob(func, interval, **kwargs)
+        self.jobs.append(job)
+        if self._tasks:
+            self._tasks.append(asyncio.create_task(self._loop(job), name=job.name))
+        return job
+
+    async def _loop(self, job):
+        if not job.run_immediately:
+            await asyncio.sleep(job.next_delay())
+        while True:
+            started = time.monotonic()
+            await job.run_once()
+            await asyncio.sleep(job.next_delay(started))
+
+    def start(self):
+        """Start every registered job; must be called from a running loop."""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._loop(job), name=job.name)
+                for job in self.jobs
+            ]
+        return self._tasks
+
+    async def run(self):
+        """Run the jobs until the scheduler is stopped or cancelled."""
+        self.start()
+        try:
+            await asyncio.gather(*self._tasks)
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,256 @@
+import time
+import asyncio
+import inspect
+import logging
+from datetime import date, timedelta
+from eadconnect.api import ITEMS_KEYS
+from eadconnect.services.scheduler import AsyncScheduler
+from eadconnect.utils.manifest import content_hash
+from eadconnect.utils.pagination import extract_items
+
+logger = logging.getLogger(__name__)
+
+NEW = "new"
+CHANGED = "changed"
+
+
+class WatchEvent:
+    """An item that appeared or changed in a feed since the previous poll."""
+
+    __slots__ = ('feed', 'kind', 'key', 'item')
+
+    def __init__(self, feed, kind, key, item):
+        self.feed = feed
+        self.kind = kind
+        self.key = key
+        self.item = item
+
+    def __repr__(self):
+        return f"WatchEvent({self.feed!r}, {self.kind!r}, {self.key!r})"
+
+
+def log_notifier(events):
+    """Default notifier: just logs the events."""
+    for event in events:
+        logger.info(f"[{event.feed}] {event.kind}: {event.key}")
+
+
+class Feed:
+    """One watched endpoint call and what was seen in it.
+
+    ``method`` is the name of an `EducationAPI` method and ``params`` its
+    keyword arguments, or a callable returning them on every poll (for
+    date windows). Items are taken out of the response with ``items``, or
+    with `extract_items` and ``items_key``, and identified by ``key`` (the
+    ``id`` field by default, the content hash for items without one).
+
+    Each poll first compares the hash of the whole response with the previous
+    one, so an unchanged feed costs one hash. Only when it differs are the
+    items compared, one dict lookup each, against the hashes seen before.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            method: str,
+            interval: float,
+            params=None,
+            items_key: str = None,
+            items=None,
+            key=None,
+            notify_initial: bool = False
+    ):
+        self.name = name
+        self.method = method
+        self.interval = interval
+        self.params = params or {}
+        self.items_key = items_key
+        self.items = items
+        self.key = key
+        self.notify_initial = notify_initial
+        self.seen = {}
+        self.digest = None
+        self.polls = 0
+
+    def resolve_params(self):
+        return self.params() if callable(self.params) else dict(self.params)
+
+    def item_key(self, item):
+        if self.key:
+            return self.key(item)
+        if isinstance(item, dict) and item.get('id') is not None:
+            return item['id']
+        return content_hash(item)
+
+    def diff(self, page):
+        """Return the `WatchEvent`s of ``page`` and remember its items."""
+        digest = content_hash(page)
+        first_poll = self.digest is None
+        self.polls += 1
+        if digest == self.digest:
+            return []
+        self.digest = digest
+
+        items = self.items(page) if self.items else extract_items(page, self.items_key)
+        events = []
+        for item in items:
+            if item is None:
+                continue
+            key = self.item_key(item)
+            item_digest = content_hash(item)
+            previous = self.seen.get(key)
+            if previous == item_digest:
+                continue
+            self.seen[key] = item_digest
+            if not first_poll or self.notify_initial:
+                events.append(WatchEvent(self.name, NEW if previous is None else CHANGED, key, item))
+        return events
+
+
+class FeedWatcher:
+    """Polls several API feeds, each on its own interval, and reports news.
+
+    Feeds run as jobs of an `AsyncScheduler`; the blocking `EducationAPI`
+    calls go to worker threads, at most ``max_concurrency`` at a time. Feeds
+    that resolve to the same method and arguments share the call: a poll
+    joins one that is already in flight and reuses a result younger than
+    ``coalesce_window`` seconds, so watching the same endpoint from several
+    feeds does not add requests.
+
+    New and changed items go to ``notifier(events)``, which may be a plain
+    function or a coroutine function. The first poll of a feed only records
+    what exists unless the feed was added with ``notify_initial=True``.
+
+    Usage::
+
+        watcher = FeedWatcher(client, notifier=send_to_telegram)
+        watcher.add_default_feeds(courses=[3187911])
+        await watcher.run()
+    """
+
+    def __init__(
+            self,
+            client,
+            notifier=None,
+            scheduler: AsyncScheduler = None,
+            max_concurrency: int = 4,
+            coalesce_window: float = 5.0,
+            jitter: float = 0.1
+    ):
+        self.client = client
+        self.notifier = notifier or log_notifier
+        self.scheduler = scheduler or AsyncScheduler()
+        self.coalesce_window = coalesce_window
+        self.jitter = jitter
+        self.feeds = {}
+        self.requests = 0
+        self.coalesced = 0
+        self._max_concurrency = max_concurrency
+        self._semaphore = None
+        self._in_flight = {}
+        self._results = {}
+
+    def add_feed(self, name: str, method: str, interval: float = 300, **kwargs) -> Feed:
+        """Watch ``client.<method>(**params)`` every ``interval`` seconds."""
+        if name in self.feeds:
+            raise ValueError(f"Feed '{name}' already exists")
+
+        feed = self.feeds[name] = Feed(name, method, interval, **kwargs)
+        self.scheduler.every(interval, lambda: self.poll(feed), jitter=self.jitter, name=f"feed:{name}")
+        return feed
+
+    def add_default_feeds(
+            self,
+            courses=(),
+            notices_interval: float = 600,
+            messages_interval: float = 300,
+            calendar_interval: float = 3600,
+            grades_interval: float = 900,
+            calendar_days: int = 30
+    ):
+        """Watch notices, messages, the calendar and, per course, notice boards and grades."""
+        self.add_feed('notices', 'get_notices', notices_interval, items_key=ITEMS_KEYS['get_notices'])
+        self.add_feed('messages', 'get_messages', messages_interval, items_key=ITEMS_KEYS['get_messages'])
+        self.add_feed(
+            'calendar',
+            'get_calendar',
+            calendar_interval,
+            params=lambda: {
+                'start_date': date.today().isoformat(),
+                'end_date': (date.today() + timedelta(days=calendar_days)).isoformat()
+            }
+        )
+        for course_id in courses:
+            self.add_feed(
+                f'notices_board:{course_id}',
+                'get_notices_board',
+                notices_interval,
+                params={'course_id': course_id},
+                items_key=ITEMS_KEYS['get_notices_board']
+            )
+            self.add_feed(
+                f'grades:{course_id}',
+                'get_grades',
+                grades_interval,
+                params={'course_id': course_id},
+                items=lambda page: [page.get('finalGrade')],
+                key=lambda item, course_id=course_id: course_id
+            )
+
+    async def _fetch(self, method, params):
+        source = (method, tuple(sorted(params.items())))
+        cached = self._results.get(source)
+        if cached and time.monotonic() - cached[0] < self.coalesce_window:
+            self.coalesced += 1
+            return cached[1]
+
+        in_flight = self._in_flight.get(source)
+        if in_flight:
+            self.coalesced += 1
+            return await asyncio.shield(in_flight)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[source] = future
+        try:
+            async with self._semaphore:
+                self.requests += 1
+                page = await asyncio.to_thread(getattr(self.client, method), **params)
+            if not isinstance(page, (dict, list)):
+                raise RuntimeError(f"{method} failed: {page}")
+            self._results[source] = (time.monotonic(), page)
+            future.set_result(page)
+            return page
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[source]
+
+    async def poll(self, feed: Feed):
+        """Poll one feed now and notify its new or changed items."""
+        page = await self._fetch(feed.method, feed.resolve_params())
+        events = feed.diff(page)
+        if events:
+            result = self.notifier(events)
+            if inspect.isawaitable(result):
+                await result
+        return events
+
+    async def poll_all(self):
+        """Poll every feed once, concurrently; returns ``{name: events}``."""
+        names = list(self.feeds)
+        results = await asyncio.gather(
+            *(self.poll(self.feeds[name]) for name in names),
+            return_exceptions=True
+        )
+        return dict(zip(names, results))
+
+    async def run(self):
+        await self.scheduler.run()
+
+    async def stop(self):
+        await self.scheduler.stop()
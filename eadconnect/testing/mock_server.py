@@ -0,0 +1,326 @@
+import re
+import ssl
+import json
+import time
+import base64
+import random
+import threading
+from collections import Counter
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+def make_token(subject: str = "student", ttl: int = 3600):
+    """Unsigned JWT carrying an ``exp`` claim, enough for `TokenManager`."""
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    claims = {"sub": subject, "exp": int(time.time()) + ttl}
+    return f"{encode({'alg': 'none', 'typ': 'JWT'})}.{encode(claims)}.mock"
+
+
+class MockPlatformData:
+    """Deterministic fake content served by `MockPlatformServer`."""
+
+    def __init__(
+            self,
+            courses: int = 4,
+            topics_per_course: int = 10,
+            questions_per_topic: int = 10,
+            messages: int = 60,
+            notices: int = 30,
+            seed: int = 42
+    ):
+        rng = random.Random(seed)
+        self.period_id = 11903
+        self.courses = [
+            {
+                'id': 3187000 + index,
+                'name': f"Disciplina {index} (EAD)",
+                'status': 'isActual' if index % 4 else 'isFinished',
+                'period': self.period_id
+            }
+            for index in range(1, courses + 1)
+        ]
+        self.topics = {
+            course['id']: [
+                {'id': course['id'] * 100 + index, 'title': f"Tópico {index}"}
+                for index in range(1, topics_per_course + 1)
+            ]
+            for course in self.courses
+        }
+        self.grades = {
+            course['id']: round(rng.uniform(0, 10), 1)
+            for course in self.courses
+        }
+        self.questions_per_topic = questions_per_topic
+        self.messages = [
+            {
+                'id': index,
+                'messages': [{'id': index, 'subject': f"Mensagem {index}", 'body': '<p>Olá</p>'}]
+            }
+            for index in range(messages, 0, -1)
+        ]
+        self.notices = [
+            {'id': index, 'title': f"Aviso {index}", 'postedAt': f"2026-01-{index % 28 + 1:02d}"}
+            for index in range(notices, 0, -1)
+        ]
+
+    def questions(self, topic_id):
+        return [
+            {
+                'enunciated': f"<p>Questão {index} do tópico {topic_id}&nbsp;<b>texto</b></p>",
+                'options': [
+                    {
+                        'text': f"<p>Alternativa {letter}</p>",
+                        'feedback': f"<p>Justificativa da alternativa {letter}.</p>",
+                        'isCorrect': letter == 'B'
+                    }
+                    for letter in 'ABCDE'
+                ]
+            }
+            for index in range(1, self.questions_per_topic + 1)
+        ]
+
+
+def _page(items, query, page_key='page', size_key='perPage', default_size=15):
+    page = int(query.get(page_key, ['1'])[0])
+    size = int(query.get(size_key, [str(default_size)])[0])
+    return items[(page - 1) * size:page * size]
+
+
+class MockPlatformServer:
+    """Local stand-in for ``api.plataforma.grupoa.education``.
+
+    Implements the endpoints used by `EducationAPI` (signin, role/assume,
+    users/me, courses/me, contents, topics, grades, calendar, messages,
+    notices) on a threaded HTTP server, with injectable faults:
+
+    - ``latency``: seconds added to each response, or a ``(min, max)`` range;
+    - ``error_rate``: fraction of requests answered with 500;
+    - ``rate_limit``: requests per second above which the server answers 429
+      with a ``Retry-After`` header (0 disables it).
+
+    Pass ``certfile``/``keyfile`` to serve HTTPS. Point a client at it with
+    ``client.URL_API = server.url``::
+
+        with MockPlatformServer(latency=0.02) as server:
+            client = EducationAPI("faesa", "user", "pass")
+            client.URL_API = server.url
+    """
+
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            data: MockPlatformData = None,
+            latency=0.0,
+            error_rate: float = 0.0,
+            rate_limit: float = 0.0,
+            certfile: str = None,
+            keyfile: str = None,
+            seed: int = 42
+    ):
+        self.data = data or MockPlatformData(seed=seed)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.requests = Counter()
+        self.statuses = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._thread = None
+        self._routes = [
+            ('POST', r'/v2/safea-client/auth/signin/tenants/[^/]+$', self._signin, False),
+            ('PUT', r'/v2/safea-client/auth/role/assume$', self._assume_role, False),
+            ('GET', r'/v2/safea-client/users/me$', self._me, True),
+            ('GET', r'/v1/plataforma/academic/courses/period/me$', self._periods, True),
+            ('GET', r'/v1/plataforma/academic/courses/me$', self._my_courses, True),
+            ('GET', r'/v1/plataforma/academic/courses/(\d+)/notices-board$', self._course_notices, True),
+            ('GET', r'/v1/plataforma/academic/notices-board$', self._notices, True),
+            ('GET', r'/v2/plataforma/content/academics-main/(\d+)/contents$', self._contents, True),
+            ('GET', r'/v2/plataforma/content/academics-main/(\d+)/topics/(\d+)$', self._topic, True),
+            ('GET', r'/v1/plataforma/grades/me/course/(\d+)$', self._grades, True),
+            ('GET', r'/v1/plataforma/calendar/appointment$', self._calendar, True),
+            ('GET', r'/v1/message/messages$', self._messages, True),
+        ]
+        self._routes = [
+            (method, re.compile(pattern), handler, protected)
+            for method, pattern, handler, protected in self._routes
+        ]
+
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.scheme = "http"
+        if certfile:
+            context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            context.load_cert_chain(certfile, keyfile)
+            self.httpd.socket = context.wrap_socket(self.httpd.socket, server_side=True)
+            self.scheme = "https"
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"{self.scheme}://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # Fault injection
+
+    def _delay(self):
+        latency = self.latency
+        if isinstance(latency, (tuple, list)):
+            latency = self._random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+
+    def _fault(self):
+        """Return an injected ``(status, headers)`` or None."""
+        with self._lock:
+            if self.rate_limit:
+                now = time.monotonic()
+                if now - self._window_start >= 1:
+                    self._window_start, self._window_count = now, 0
+                self._window_count += 1
+                if self._window_count > self.rate_limit:
+                    retry_after = max(1, int(self._window_start + 1 - now + 0.999))
+                    return 429, {'Retry-After': str(retry_after)}
+            if self.error_rate and self._random.random() < self.error_rate:
+                return 500, {}
+        return None
+
+    # Handlers: (match, query, body) -> JSON data
+
+    def _signin(self, match, query, body):
+        return {'accessToken': make_token(body.get('username', 'student'))}
+
+    def _assume_role(self, match, query, body):
+        return {'accessToken': make_token(body.get('roleAlias', 'student'))}
+
+    def _me(self, match, query, body):
+        return {'user': {'name': 'Estudante Teste', 'email': 'estudante@example.com'}}
+
+    def _periods(self, match, query, body):
+        return [{'id': self.data.period_id, 'name': '2026/1'}]
+
+    def _my_courses(self, match, query, body):
+        return {'courses': _page(self.data.courses, query, size_key='limit', default_size=20)}
+
+    def _notices(self, match, query, body):
+        return {'notices': _page(self.data.notices, query)}
+
+    def _course_notices(self, match, query, body):
+        return {'notices': _page(self.data.notices, query, default_size=5)}
+
+    def _contents(self, match, query, body):
+        course_id = int(match.group(1))
+        if course_id not in self.data.topics:
+            return None
+        return {
+            'topics': [
+                {'title': 'Apresentação', 'children': []},
+                {'title': 'Material', 'children': []},
+                {'title': 'Exercícios', 'children': self.data.topics[course_id]},
+            ]
+        }
+
+    def _topic(self, match, query, body):
+        topic_id = int(match.group(2))
+        return {
+            'topics': [{}, {}, {}, {}, {'content': {'questions': self.data.questions(topic_id)}}]
+        }
+
+    def _grades(self, match, query, body):
+        course_id = int(match.group(1))
+        if course_id not in self.data.grades:
+            return None
+        return {'finalGrade': {'value': self.data.grades[course_id]}}
+
+    def _calendar(self, match, query, body):
+        return [
+            {'id': index, 'title': f"Atividade {index}", 'startDate': query.get('startDate', [''])[0]}
+            for index in range(1, 6)
+        ]
+
+    def _messages(self, match, query, body):
+        return {'conversations': _page(self.data.messages, query)}
+
+    def _dispatch(self, method, raw_path, headers, raw_body):
+        parts = urlsplit(raw_path)
+        query = parse_qs(parts.query)
+        for route_method, pattern, handler, protected in self._routes:
+            match = pattern.search(parts.path)
+            if not match or route_method != method:
+                continue
+
+            with self._lock:
+                self.requests[f"{method} {pattern.pattern}"] += 1
+            self._delay()
+            fault = self._fault()
+            if fault:
+                status, extra = fault
+                return status, extra, {'message': 'injected failure'}
+            if protected and not headers.get('Authorization'):
+                return 401, {}, {'message': 'Unauthorized'}
+            try:
+                body = json.loads(raw_body) if raw_body else {}
+            except json.JSONDecodeError:
+                return 400, {}, {'message': 'invalid JSON'}
+            data = handler(match, query, body)
+            if data is None:
+                return 404, {}, {'message': 'Not Found'}
+            return 200, {}, data
+
+        return 404, {}, {'message': 'Not Found'}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw_body = self.rfile.read(length) if length else b''
+                status, extra, data = server._dispatch(
+                    self.command,
+                    self.path,
+                    self.headers,
+                    raw_body
+                )
+                with server._lock:
+                    server.statuses[status] += 1
+                payload = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                for name, value in extra.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_HEAD = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -1,22 +1,121 @@
+import os
 import json
+import base64
 import logging
 import time
+import tempfile
+import threading
+from collections import deque
+from pathlib import Path
+from contextlib import contextmanager
 from eadconnect.config import CREDENTIALS
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Margem (em segundos) para renovar o token antes de ele expirar.
+REFRESH_MARGIN = 300
+
+# Quantos tokens já entregues ao cliente o `TokenManager` ainda reconhece.
+ISSUED_TOKENS = 8
+
+
+class TokenStore:
+    """Arquivo de credenciais compartilhado entre processos.
+
+    As gravações são atômicas (arquivo temporário + ``os.replace``), então
+    um leitor nunca vê um JSON pela metade, e `lock` é um lock consultivo
+    em ``<arquivo>.lock`` que serializa o login: só um processo autentica
+    enquanto os outros esperam e reaproveitam o token gravado.
+    """
+
+    def __init__(self, path=CREDENTIALS):
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+
+    def load(self) -> str | None:
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f).get("accessToken")
+        except (json.JSONDecodeError, IOError):
+            return None
+
+    def save(self, token: str | None):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix=".json", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"accessToken": token}, f, indent=4)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @contextmanager
+    def lock(self):
+        """Lock exclusivo entre processos (bloqueia até ser obtido)."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a+b") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield self
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
 
 def load_access_token() -> str | None:
     """Carrega o token de acesso armazenado no arquivo."""
-    if CREDENTIALS.exists():
-        with open(CREDENTIALS, "r") as f:
-            credentials = json.load(f)
-            return credentials.get("accessToken")
-    return None
+    return TokenStore().load()
 
 
 def save_access_token(token: str | None):
     """Salva o token de acesso no arquivo de credenciais."""
-    with open(CREDENTIALS, "w") as f:
-        json.dump({"accessToken": token}, f, indent=4)
+    TokenStore().save(token)
+
+
+def token_claims(token: str | None) -> dict | None:
+    """Lê localmente as claims de um token JWT (sem verificar a assinatura)."""
+    if not token:
+        return None
+    try:
+        payload = token.split()[-1].split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, TypeError, ValueError):
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+def token_expiry(token: str | None) -> float | None:
+    """Lê localmente a data de expiração (claim ``exp``) de um token JWT."""
+    try:
+        return float(token_claims(token)["exp"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def is_token_fresh(token: str | None, margin: float = 0) -> bool | None:
+    """Indica se o token ainda vale por ``margin`` segundos, sem consultar a API.
+
+    Retorna None quando o token não traz a data de expiração.
+    """
+    expiry = token_expiry(token)
+    if expiry is None:
+        return None
+    return expiry - margin > time.time()
 
 
 def is_token_valid(client, token: str) -> bool:
@@ -27,40 +126,181 @@ def is_token_valid(client, token: str) -> bool:
         return False
 
 
-def authenticate(client, attempts: int = 5, auto_save: bool = True) -> str | None:
-    """Autentica com a API usando o access_token armazenado ou refaz login se necessário."""
+def _check_token(client, token: str | None) -> bool:
+    """Valida pelo ``exp`` do token e só consulta /me se ele não existir."""
+    if not token:
+        return False
+    fresh = is_token_fresh(token)
+    if fresh is not None:
+        return fresh
+    return bool(is_token_valid(client, token))
+
+
+def login(client) -> str | None:
+    """Faz login e assume o papel de estudante, retornando o novo token."""
+    login_response = client.login()
+
+    if not isinstance(login_response, dict):
+        logging.error("Erro ao fazer login: resposta inválida.")
+        return None
+
+    role_response = client.persist_access_token(
+        login_response.get('accessToken')
+    )
+    access_token = role_response.get('accessToken') if isinstance(role_response, dict) else None
+    if not access_token:
+        raise Exception("Falha ao obter o token de acesso.")
+
+    return access_token
+
+
+def authenticate(
+        client,
+        attempts: int = 5,
+        auto_save: bool = True,
+        store: TokenStore = None
+) -> str | None:
+    """Autentica com a API usando o access_token armazenado ou refaz login se necessário.
+
+    O login acontece com o lock do ``store``: processos concorrentes esperam
+    e reaproveitam o token gravado por quem autenticou primeiro.
+    """
+    store = store or TokenStore()
+    stored_token = store.load()
     for attempt in range(attempts):
-        access_token = load_access_token()
-        if access_token and is_token_valid(client, access_token):
+        access_token, stored_token = stored_token, None
+        if _check_token(client, access_token):
             return access_token
 
-        if not access_token:
-            login_response = client.login()
+        rejected_token = access_token
+        with store.lock():
+            access_token = store.load()
+            if access_token and access_token != rejected_token and _check_token(client, access_token):
+                return access_token
 
-            if not isinstance(login_response, dict):
-                logging.error("Erro ao fazer login: resposta inválida.")
+            access_token = login(client)
+            if access_token is None:
                 return None
 
-            access_token = client.persist_access_token(
-                login_response.get('accessToken')
-            ).get('accessToken')
-
-            if not access_token:
-                raise Exception("Falha ao obter o token de acesso.")
-
-        if auto_save:
-            save_access_token(access_token)
+            if auto_save:
+                store.save(access_token)
 
-        if is_token_valid(client, access_token):
+        if _check_token(client, access_token):
             return access_token
 
-        save_access_token(None)
+        store.save(None)
 
         time.sleep(1)
 
     raise Exception("Falha na autenticação após múltiplas tentativas.")
 
 
+class TokenManager:
+    """Mantém o ``access_token`` de um `EducationAPI` sempre válido.
+
+    A validade é lida do próprio JWT, então iniciar com um token salvo não
+    custa nenhuma requisição. Um timer em segundo plano refaz o login
+    ``refresh_margin`` segundos antes da expiração e, se mesmo assim a API
+    responder 401, o cliente chama `handle_unauthorized` e repete a
+    requisição uma única vez com o token novo.
+    """
+
+    def __init__(
+            self,
+            client,
+            refresh_margin: float = REFRESH_MARGIN,
+            auto_save: bool = True,
+            store: TokenStore = None
+    ):
+        self.client = client
+        self.refresh_margin = refresh_margin
+        self.auto_save = auto_save
+        self.store = store or TokenStore()
+        self._lock = threading.Lock()
+        self._timer = None
+        self._issued = deque(maxlen=ISSUED_TOKENS)
+
+    def start(self, attempts: int = 5) -> str | None:
+        """Autentica, instala o gerenciador no cliente e agenda a renovação."""
+        access_token = authenticate(self.client, attempts, self.auto_save, self.store)
+        self.client.access_token = access_token
+        self._issued.append(access_token)
+        self.client.token_manager = self
+        self._schedule(access_token)
+        return access_token
+
+    def stop(self):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if getattr(self.client, 'token_manager', None) is self:
+            self.client.token_manager = None
+
+    def refresh(self) -> str | None:
+        """Refaz o login e atualiza o token do cliente."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self):
+        current_token = self.client.access_token
+        with self.store.lock():
+            # Outro processo pode ter renovado o token enquanto esperávamos.
+            access_token = self.store.load()
+            if (
+                    not access_token
+                    or access_token == current_token
+                    or not is_token_fresh(access_token, self.refresh_margin)
+            ):
+                access_token = login(self.client)
+                if not access_token:
+                    logging.error("Não foi possível renovar o token de acesso.")
+                    return None
+
+                if self.auto_save:
+                    self.store.save(access_token)
+
+        self.client.access_token = access_token
+        self._issued.append(access_token)
+        self._schedule(access_token)
+        logging.info("Token de acesso renovado.")
+        return access_token
+
+    def handle_unauthorized(self, failed_token: str) -> str | None:
+        """Token com que repetir uma requisição recusada com ``failed_token``.
+
+        Se outra thread já renovou o token enquanto a requisição estava em
+        andamento, devolve o token atual sem refazer o login. Tokens que não
+        foram entregues por este gerenciador (como o passado a ``check_me``)
+        não são renovados: retorna None.
+        """
+        with self._lock:
+            if failed_token not in self._issued:
+                return None
+            if self.client.access_token and self.client.access_token != failed_token:
+                return self.client.access_token
+            return self._refresh()
+
+    def _schedule(self, access_token):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        expiry = token_expiry(access_token)
+        if expiry is None:
+            return
+
+        delay = max(expiry - self.refresh_margin - time.time(), 0)
+        self._timer = threading.Timer(delay, self._refresh_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            logging.exception(f"Erro ao renovar o token de acesso: {e}")
+
+
 def check_credentials(username: str | None, password: str | None) -> bool:
     """Verifica se as credenciais básicas estão presentes."""
     return bool(username and password)
@@ -1,7 +1,16 @@
+import os
 import json
 import shutil
+import zipfile
+import tempfile
+import threading
 from pathlib import Path
-from eadconnect.utils.pdf import PDF
+from contextlib import contextmanager
+from eadconnect.utils.manifest import (
+    CHANGED,
+    SKIPPED,
+    content_hash
+)
 from eadconnect.config import (
     pdf_path,
     json_path,
@@ -47,6 +56,134 @@ def zip_directory(directory):
     )
 
 
+def _file_crc32(file_path, chunk_size=1024 * 1024):
+    crc = 0
+    with open(file_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            crc = zipfile.crc32(chunk, crc)
+    return crc
+
+
+def _copy_member(source, target, info, chunk_size=1024 * 1024):
+    """Copia um membro de ``source`` para ``target`` preservando seus metadados.
+
+    Nome, data, tipo de compressão, atributos e comentário vêm do ZipInfo
+    original; o conteúdo passa em blocos, sem carregar o membro inteiro.
+    """
+    copied = zipfile.ZipInfo(info.filename, info.date_time)
+    copied.compress_type = info.compress_type
+    copied.create_system = info.create_system
+    copied.external_attr = info.external_attr
+    copied.comment = info.comment
+    copied.file_size = info.file_size
+    with source.open(info) as reader, target.open(copied, "w") as writer:
+        shutil.copyfileobj(reader, writer, chunk_size)
+
+
+# Um lock por zip, compartilhado por todas as instâncias de `ArchiveManager`
+# do mesmo diretório (``save_exercise_data`` cria uma a cada chamada).
+_archive_locks = {}
+
+
+def _archive_lock(archive_path):
+    return _archive_locks.setdefault(os.path.abspath(archive_path), threading.RLock())
+
+
+class ArchiveManager:
+    """Mantém o .zip de um diretório atualizado arquivo a arquivo.
+
+    O arquivo compactado é o mesmo gerado por `zip_directory`
+    (``<diretório>.zip`` ao lado da pasta). Arquivos novos são anexados ao
+    zip existente, arquivos idênticos ao membro atual são ignorados e só uma
+    substituição de conteúdo obriga a regravar o zip, copiando os demais
+    membros. Dentro de `batch` as alterações são acumuladas e aplicadas
+    numa única passada no final. Instâncias do mesmo diretório compartilham
+    o lock do zip, então threads diferentes nunca o regravam ao mesmo tempo.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.archive_path = Path(f"{self.directory.as_posix()}.zip")
+        self._pending = {}
+        self._deferred = False
+        self._lock = _archive_lock(self.archive_path)
+
+    def _arcname(self, file_path):
+        return Path(file_path).relative_to(self.directory).as_posix()
+
+    def add(self, *file_paths):
+        """Inclui ou atualiza os arquivos informados no zip."""
+        with self._lock:
+            for file_path in file_paths:
+                self._pending[self._arcname(file_path)] = Path(file_path)
+            if not self._deferred:
+                self.flush()
+
+    @contextmanager
+    def batch(self):
+        """Adia as alterações até o fim do bloco ``with``."""
+        with self._lock:
+            self._deferred = True
+            try:
+                yield self
+            finally:
+                self._deferred = False
+                self.flush()
+
+    def flush(self):
+        with self._lock:
+            files, self._pending = self._pending, {}
+            if not files:
+                return
+
+            if not self.archive_path.exists():
+                self.rebuild()
+                return
+
+            with zipfile.ZipFile(self.archive_path) as archive:
+                current = {info.filename: info for info in archive.infolist()}
+
+            appended, replaced = {}, {}
+            for arcname, file_path in files.items():
+                info = current.get(arcname)
+                if info is None:
+                    appended[arcname] = file_path
+                elif (
+                        info.file_size != file_path.stat().st_size
+                        or info.CRC != _file_crc32(file_path)
+                ):
+                    replaced[arcname] = file_path
+
+            if replaced:
+                self._rewrite({**appended, **replaced})
+            elif appended:
+                with zipfile.ZipFile(self.archive_path, "a", zipfile.ZIP_DEFLATED) as archive:
+                    for arcname, file_path in appended.items():
+                        archive.write(file_path, arcname)
+
+    def _rewrite(self, files):
+        fd, temp_path = tempfile.mkstemp(suffix=".zip", dir=self.archive_path.parent)
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(self.archive_path) as source, \
+                    zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as target:
+                for info in source.infolist():
+                    if info.filename not in files:
+                        _copy_member(source, target, info)
+                for arcname, file_path in files.items():
+                    target.write(file_path, arcname)
+            os.replace(temp_path, self.archive_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def rebuild(self):
+        """Recria o zip a partir de todo o conteúdo do diretório."""
+        with self._lock:
+            self._pending = {}
+            zip_directory(self.directory)
+
+
 def zip_json_directory(directory):
     """Compacta um diretório de PDFs em um arquivo .zip."""
     zip_directory(directory)
@@ -57,20 +194,47 @@ def zip_pdf_directory(directory):
     zip_directory(directory)
 
 
-def save_exercise_data(exercises, title, filename):
+def save_exercise_data(exercises, title, filename, manifest=None, render_pool=None):
+    """Salva o JSON e o PDF de um tópico e atualiza os zips da disciplina.
+
+    Com um `ExportManifest`, tópicos cujo conteúdo não mudou desde a última
+    exportação (e cujos JSON e PDF ainda existem) são pulados. Com um
+    `PDFRenderPool` o PDF é gerado num processo do pool. Retorna o status
+    registrado no manifesto, ou None quando nenhum é usado.
+    """
     output_json = create_json_directory(title)
-    save_json(
+    output_pdf = create_pdf_directory(title)
+    status = digest = None
+    if manifest is not None:
+        digest = content_hash(exercises)
+        status = manifest.status(filename, digest)
+        if (
+                status == SKIPPED
+                and (output_json / f"{filename}.json").exists()
+                # Mesmo nome que `PDF.create_document` dá ao arquivo.
+                and (output_pdf / f"{exercises['title']}.pdf").exists()
+        ):
+            manifest.record(filename, digest, status)
+            return status
+        if status == SKIPPED:
+            status = CHANGED
+
+    json_file = save_json(
         exercises,
         output_json,
         filename
     )
-    zip_json_directory(output_json)
+    ArchiveManager(output_json).add(json_file)
 
-    output_pdf = create_pdf_directory(title)
-    pdf = PDF(
-        exercises,
-        output_pdf,
-        logo_path=logo_file.as_posix()
-    )
-    pdf.create_document()
-    zip_pdf_directory(output_pdf)
+    if render_pool is not None:
+        pdf_file = render_pool.submit(exercises, output_pdf, logo_file.as_posix()).result()
+    else:
+        # fpdf só é carregado quando um PDF é de fato gerado
+        from eadconnect.utils.pdf import render_pdf
+
+        pdf_file = render_pdf(exercises, output_pdf, logo_file.as_posix())
+    ArchiveManager(output_pdf).add(pdf_file)
+
+    if manifest is not None:
+        manifest.record(filename, digest, status)
+    return status
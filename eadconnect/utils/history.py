@@ -0,0 +1,196 @@
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from eadconnect.config import history_path
+
+# Stored while the platform has not published a final grade.
+NO_GRADE = 'N/A'
+
+
+class GradeChange:
+    """A grade that differs from the last one stored for the same course."""
+
+    __slots__ = ('account', 'course_id', 'course_name', 'before', 'now', 'observed_at')
+
+    def __init__(self, account, course_id, course_name, before, now, observed_at):
+        self.account = account
+        self.course_id = course_id
+        self.course_name = course_name
+        self.before = before
+        self.now = now
+        self.observed_at = observed_at
+
+    def as_dict(self):
+        return {
+            "course_id": self.course_id,
+            "course_name": self.course_name,
+            "before": self.before,
+            "now": self.now
+        }
+
+
+def final_grade_value(grades: dict):
+    """The grade stored for a ``get_grades`` payload: its ``finalGrade`` value."""
+    return (grades.get('finalGrade') or {}).get('value', NO_GRADE)
+
+
+def _dump(value):
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+
+class GradeHistory:
+    """Grade observations of many accounts in one SQLite file.
+
+    ``grades`` keeps one row per change, indexed by
+    ``(account, course_id, observed_at)`` for a course's history and by
+    ``(account, observed_at)`` for "what changed since T", so both queries
+    read only the matching rows, however long the history gets. ``latest``
+    holds the current grade of every course, which is all a new observation
+    is compared against; unchanged grades write nothing.
+
+    Usage::
+
+        history = GradeHistory()
+        changes = history.record("aluno", {3187911: ("Cálculo I", 8.5)})
+        recent = history.changes_since("aluno", time.time() - 86400)
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path or history_path / "grades.sqlite3")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS grades (
+                id INTEGER PRIMARY KEY,
+                account TEXT NOT NULL,
+                course_id INTEGER NOT NULL,
+                course_name TEXT,
+                grade TEXT,
+                previous TEXT,
+                observed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS grades_account_course_observed
+                ON grades (account, course_id, observed_at);
+            CREATE INDEX IF NOT EXISTS grades_account_observed
+                ON grades (account, observed_at);
+            CREATE TABLE IF NOT EXISTS latest (
+                account TEXT NOT NULL,
+                course_id INTEGER NOT NULL,
+                course_name TEXT,
+                grade TEXT,
+                observed_at REAL NOT NULL,
+                PRIMARY KEY (account, course_id)
+            ) WITHOUT ROWID;
+            """
+        )
+
+    def latest(self, account):
+        """Current ``{course_id: (course_name, grade)}`` of an account."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT course_id, course_name, grade FROM latest WHERE account = ?",
+                (account,)
+            ).fetchall()
+        return {
+            course_id: (course_name, json.loads(grade))
+            for course_id, course_name, grade in rows
+        }
+
+    def record(self, account, grades: dict, observed_at: float = None):
+        """Store ``{course_id: (course_name, grade)}`` and return what changed.
+
+        Only courses whose grade differs from the stored one are written, in a
+        single transaction. A course seen for the first time is a change with
+        ``before`` set to None.
+        """
+        observed_at = time.time() if observed_at is None else observed_at
+        changes = []
+        with self._lock:
+            stored = {
+                course_id: grade
+                for course_id, grade in self._connection.execute(
+                    "SELECT course_id, grade FROM latest WHERE account = ?",
+                    (account,)
+                )
+            }
+            rows = []
+            for course_id, (course_name, grade) in grades.items():
+                dumped = _dump(grade)
+                previous = stored.get(course_id)
+                if previous == dumped:
+                    continue
+                rows.append((account, course_id, course_name, dumped, previous, observed_at))
+                changes.append(GradeChange(
+                    account,
+                    course_id,
+                    course_name,
+                    None if previous is None else json.loads(previous),
+                    grade,
+                    observed_at
+                ))
+
+            if rows:
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT INTO grades (account, course_id, course_name, grade, previous, observed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        rows
+                    )
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO latest VALUES (?, ?, ?, ?, ?)",
+                        [(row[0], row[1], row[2], row[3], row[5]) for row in rows]
+                    )
+        return changes
+
+    def _changes(self, query, args):
+        with self._lock:
+            rows = self._connection.execute(query, args).fetchall()
+        return [
+            GradeChange(
+                account,
+                course_id,
+                course_name,
+                None if previous is None else json.loads(previous),
+                json.loads(grade),
+                observed_at
+            )
+            for account, course_id, course_name, grade, previous, observed_at in rows
+        ]
+
+    def changes_since(self, account, since: float):
+        """Changes of an account observed after ``since`` (a Unix timestamp)."""
+        return self._changes(
+            "SELECT account, course_id, course_name, grade, previous, observed_at FROM grades "
+            "WHERE account = ? AND observed_at > ? ORDER BY observed_at",
+            (account, since)
+        )
+
+    def history(self, account, course_id, since: float = 0):
+        """Every recorded grade of one course, oldest first."""
+        return self._changes(
+            "SELECT account, course_id, course_name, grade, previous, observed_at FROM grades "
+            "WHERE account = ? AND course_id = ? AND observed_at > ? ORDER BY observed_at",
+            (account, course_id, since)
+        )
+
+    def accounts(self):
+        with self._lock:
+            return [
+                row[0] for row in
+                self._connection.execute("SELECT DISTINCT account FROM latest")
+            ]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,82 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from eadconnect.config import json_path
+
+ADDED = "added"
+CHANGED = "changed"
+SKIPPED = "skipped"
+
+
+def content_hash(payload):
+    """Hash estável do conteúdo de um tópico (independe da ordem das chaves)."""
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ExportManifest:
+    """Manifesto com o hash de cada tópico já exportado de uma disciplina.
+
+    Fica em ``json_path/<disciplina>.manifest.json``, ao lado das pastas da
+    disciplina (fora delas, para não entrar no zip). Tópicos cujo hash não
+    mudou desde a última exportação podem ser pulados.
+    """
+
+    def __init__(self, course_name, directory=json_path):
+        self.course_name = course_name
+        self.path = directory / f"{course_name}.manifest.json"
+        self.entries = self._load()
+        self.summary = {ADDED: [], CHANGED: [], SKIPPED: []}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f).get("topics", {})
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+    def status(self, topic_id, digest):
+        """Retorna ``added``, ``changed`` ou ``skipped`` para o hash informado."""
+        previous = self.entries.get(str(topic_id))
+        if previous is None:
+            return ADDED
+        if previous != digest:
+            return CHANGED
+        return SKIPPED
+
+    def record(self, topic_id, digest, status):
+        """Registra o resultado da exportação de um tópico."""
+        with self._lock:
+            self.summary[status].append(str(topic_id))
+            if status != SKIPPED:
+                self.entries[str(topic_id)] = digest
+
+    def forget(self, topic_id):
+        with self._lock:
+            self.entries.pop(str(topic_id), None)
+
+    def save(self):
+        """Grava o manifesto de forma atômica."""
+        with self._lock:
+            data = {"course": self.course_name, "topics": self.entries}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix=".json", dir=self.path.parent)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=4, sort_keys=True)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+    def report(self):
+        return (
+            f"{self.course_name}: {len(self.summary[ADDED])} novo(s), "
+            f"{len(self.summary[CHANGED])} alterado(s), "
+            f"{len(self.summary[SKIPPED])} sem alteração"
+        )
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+# Pagination metadata looked up in a page, at the top level or inside one
+# of ``METADATA_KEYS``.
+METADATA_KEYS = ('meta', 'pagination')
+TOTAL_PAGES_KEYS = ('totalPages', 'lastPage', 'pageCount')
+TOTAL_ITEMS_KEYS = ('total', 'totalItems', 'totalCount')
+HAS_NEXT_KEYS = ('hasNext', 'hasMore', 'hasNextPage')
+
+
+def extract_items(page, items_key=None):
+    """Return the list of items contained in a page returned by the API.
+
+    ``items_key`` names the list inside the JSON object (``'courses'``,
+    ``'conversations'``...). When omitted the first list found is used.
+    """
+    if isinstance(page, list):
+        return page
+
+    if not isinstance(page, dict):
+        return []
+
+    if items_key:
+        if items_key not in page:
+            logging.warning(f"Page has no '{items_key}' list: {sorted(page)}")
+        return page.get(items_key) or []
+
+    for value in page.values():
+        if isinstance(value, list):
+            return value
+
+    return []
+
+
+def _metadata(data, keys, kind):
+    sources = [data] + [data[key] for key in METADATA_KEYS if isinstance(data.get(key), dict)]
+    for source in sources:
+        for key in keys:
+            if type(source.get(key)) is kind:
+                return source[key]
+    return None
+
+
+def _is_last_page(data, items, page, seen, page_size):
+    """Whether ``page`` ends the iteration, ``seen`` items having been yielded.
+
+    A has-next flag or the total of pages or items in the response wins
+    over the page size: a server capping ``perPage`` returns short pages
+    that are not the last one.
+    """
+    if not items:
+        return True
+
+    if isinstance(data, dict):
+        has_next = _metadata(data, HAS_NEXT_KEYS, bool)
+        if has_next is not None:
+            return not has_next
+        total_pages = _metadata(data, TOTAL_PAGES_KEYS, int)
+        if total_pages is not None:
+            return page >= total_pages
+        total_items = _metadata(data, TOTAL_ITEMS_KEYS, int)
+        if total_items is not None:
+            return seen >= total_items
+
+    return len(items) < page_size
+
+
+def iter_pages(
+        fetch,
+        items_key=None,
+        page_size: int = 15,
+        start_page: int = 1,
+        prefetch: bool = False,
+        max_pages: int = None
+):
+    """Yield every item of a paginated endpoint, one page at a time.
+
+    ``fetch(page, items_per_page)`` must return the decoded page. The last
+    page is recognised by the pagination metadata of the response (see
+    `_is_last_page`), or else by a page shorter than ``page_size``. Only one
+    page is kept in memory; with ``prefetch`` the next page is requested in
+    a background thread while the caller consumes the current one.
+    """
+    page = start_page
+    seen = 0
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        pending = executor.submit(fetch, page, page_size) if executor else None
+        while True:
+            data = pending.result() if pending else fetch(page, page_size)
+            items = extract_items(data, items_key)
+            if not isinstance(data, (dict, list)):
+                logging.warning(f"Pagination stopped at page {page}: unexpected response.")
+
+            seen += len(items)
+            last_page = _is_last_page(data, items, page, seen, page_size)
+            if max_pages is not None and page + 1 >= start_page + max_pages:
+                last_page = True
+            if executor and not last_page:
+                pending = executor.submit(fetch, page + 1, page_size)
+
+            yield from items
+
+            if last_page:
+                return
+            page += 1
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+        fetch,
+        items_key=None,
+        page_size: int = 15,
+        start_page: int = 1,
+        prefetch: bool = False,
+        max_pages: int = None
+):
+    """Async version of `iter_pages` for coroutine ``fetch`` functions."""
+    page = start_page
+    seen = 0
+    pending = asyncio.ensure_future(fetch(page, page_size)) if prefetch else None
+    try:
+        while True:
+            data = await pending if pending else await fetch(page, page_size)
+            pending = None
+            items = extract_items(data, items_key)
+            if not isinstance(data, (dict, list)):
+                logging.warning(f"Pagination stopped at page {page}: unexpected response.")
+
+            seen += len(items)
+            last_page = _is_last_page(data, items, page, seen, page_size)
+            if max_pages is not None and page + 1 >= start_page + max_pages:
+                last_page = True
+            if prefetch and not last_page:
+                pending = asyncio.ensure_future(fetch(page + 1, page_size))
+
+            for item in items:
+                yield item
+
+            if last_page:
+                return
+            page += 1
+    finally:
+        if pending and not pending.done():
+            pending.cancel()
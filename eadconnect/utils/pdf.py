@@ -1,17 +1,10 @@
 from fpdf import FPDF
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
 from eadconnect.config import font_path
-import re
+from eadconnect.utils.text import html_to_text
 import textwrap
 
 
-def html_to_text(html):
-    text = BeautifulSoup(html, "html.parser").get_text()
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'[\u200b\u200e\u200f\u202f\u2060\u00a0]', ' ', text)
-    return text.strip()
-
-
 def safe_wrap(text, width=100):
     return '\n'.join(textwrap.wrap(text, width))
 
@@ -148,3 +141,49 @@ class PDF(FPDF):
         pdf_file = self.output_dir / f"{self.title}.pdf"
         self.output(pdf_file.as_posix())
         print(f"[INFO] PDF gerado como: {pdf_file.name}")
+        return pdf_file
+
+
+def render_pdf(data, output, logo_path=None):
+    """Gera o PDF de um tópico e retorna o caminho do arquivo.
+
+    Função de módulo para poder ser enviada a um processo do `PDFRenderPool`.
+    """
+    return PDF(data, output, logo_path=logo_path).create_document()
+
+
+class PDFRenderPool:
+    """Renderiza vários PDFs em paralelo num pool de processos.
+
+    O layout do fpdf é CPU-bound e segura o GIL, então cada documento é
+    gerado num processo separado. Uso::
+
+        with PDFRenderPool() as pool:
+            futures = [pool.submit(data, output, logo) for data in topics]
+            paths = [future.result() for future in futures]
+    """
+
+    def __init__(self, max_workers=None, mp_context=None):
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def submit(self, data, output, logo_path=None):
+        """Agenda a renderização e retorna um `Future` com o caminho do PDF."""
+        return self.executor.submit(render_pdf, data, output, logo_path)
+
+    def map(self, jobs):
+        """Renderiza ``(data, output, logo_path)`` e gera os caminhos na ordem."""
+        futures = [self.submit(*job) for job in jobs]
+        for future in futures:
+            yield future.result()
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
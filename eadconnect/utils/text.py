@@ -0,0 +1,91 @@
+import re
+from html import unescape
+from functools import lru_cache
+from html.entities import html5
+from html.parser import HTMLParser
+
+_WHITESPACE = re.compile(r'\s+')
+_INVISIBLE = str.maketrans(dict.fromkeys('\u200b\u200e\u200f\u202f\u2060\u00a0', ' '))
+# O BeautifulSoup não inclui o conteúdo destas tags no get_text().
+_SKIPPED_TAGS = frozenset(('script', 'style', 'template'))
+_NUMERIC_REFERENCE = {
+    10: re.compile(r'([0-9]+)(.*)', re.S),
+    16: re.compile(r'([0-9a-fA-F]+)(.*)', re.S)
+}
+
+
+def _numeric_reference(name):
+    """Texto de ``&#<name>;`` como o BeautifulSoup o resolve."""
+    base = 16 if name[:1] in 'xX' else 10
+    digits = name[1:] if base == 16 else name
+    match = _NUMERIC_REFERENCE[base].match(digits)
+    if match is None:
+        return digits
+
+    number, rest = int(match[1], base), match[2]
+    # unescape descarta controles e não-caracteres; o BeautifulSoup os mantém.
+    return (unescape(f'&#{number};') or chr(number)) + rest
+
+
+class _TextExtractor(HTMLParser):
+    """Coleta apenas os trechos de texto do HTML, sem montar uma árvore.
+
+    As referências de caracteres são resolvidas aqui, e não pelo
+    `HTMLParser`, da mesma forma que no BeautifulSoup: ``&foo`` sem
+    entidade correspondente fica como texto.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.parts = []
+        self._skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self._skipping += 1
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS and self._skipping:
+            self._skipping -= 1
+
+    def handle_data(self, data):
+        if not self._skipping:
+            self.parts.append(data)
+
+    def handle_entityref(self, name):
+        character = html5.get(f'{name};', html5.get(name))
+        self.handle_data(f'&{name}' if character is None else character)
+
+    def handle_charref(self, name):
+        self.handle_data(_numeric_reference(name))
+
+    def unknown_decl(self, data):
+        if data.upper().startswith('CDATA['):
+            self.handle_data(data[len('CDATA['):])
+
+
+def _normalize(text):
+    return _WHITESPACE.sub(' ', text).translate(_INVISIBLE).strip()
+
+
+@lru_cache(maxsize=4096)
+def html_to_text(html):
+    """Converte um fragmento HTML em texto de uma linha.
+
+    Produz o mesmo resultado do ``get_text()`` do BeautifulSoup (com o
+    ``html.parser``) seguido da normalização de espaços e caracteres
+    invisíveis, seções CDATA e ``&`` soltos inclusive, mas lendo o HTML em
+    fluxo. Fragmentos repetidos (alternativas, feedbacks padrão) são
+    servidos do cache.
+    """
+    if not html:
+        return ''
+
+    if '<' not in html and '&' not in html:
+        return _normalize(html)
+
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return _normalize(''.join(parser.parts))
+
@@ -3,8 +3,9 @@ from eadconnect.config import (
     load_configurations,
     save_credentials
 )
-from eadconnect.utils.auth import authenticate
-from eadconnect.utils.file_manager import save_exercise_data
+from eadconnect.utils.auth import TokenManager
+from eadconnect.http.ratelimit import RateLimiter
+from eadconnect.services.extraction_service import ExtractionPipeline
 # from eadconnect.services.notification_service import start_monitor
 
 import asyncio
@@ -43,39 +44,18 @@ async def grades_check():
         final_grade = my_grades.get('finalGrade', 'N/A')
         logger.info(f"📊 Nota Final: {final_grade['value']}")
         logger.info(f"{100 * '='}")
-        await asyncio.sleep(2)
 
 
 async def extract_data():
     logger.info("🔍 Extraindo dados dos cursos...")
-    for course in courses:
-        logger.info(f"\n📘 {course['title']}")
-        topics = client.get_contents(course['id']).get('topics')
-        # print(topics)
-        children_list = [{'id': c['id'], 'title': c['title']} for c in topics[2]['children']]
-        logger.info(f"🔍 {len(children_list)} tópicos encontrados.")
-
-        for topic in children_list:
-            logger.info(f"📝 Extraindo: {topic['title']}")
-            data = client.get_exercises(course['id'], topic['id'])
-            exercises = {
-                'discipline': course['title'],
-                'title': topic['title'],
-                'content': data['topics'][4]['content']
-            }
-            # print(exercises)
-            logger.info("🔄 Extraindo dados dos exercícios...")
-            logger.info(f"📊 {len(data['topics'][4]['content'])} exercícios encontrados.")
-            logger.info(f"💾 Salvando dados para o tópico: {topic['title']}")
-            save_exercise_data(
-                exercises,
-                course['course_name'],
-                topic['id']
-            )
-            await asyncio.sleep(2)
+    pipeline = ExtractionPipeline(client)
+    await pipeline.run(courses)
+    logger.info(f"📊 Resumo da extração:\n{pipeline.report()}")
 
 
 if __name__ == '__main__':
+    # Abre a conexão TLS com a API enquanto as credenciais são carregadas
+    client = EducationAPI("faesa", prewarm=True, rate_limiter=RateLimiter(rate=2, burst=4))
     config = load_configurations()
     username = config.get('auth', {}).get('username')
     password = config.get('auth', {}).get('password')
@@ -85,8 +65,9 @@ if __name__ == '__main__':
         save_credentials(username, password)
 
     print(username, password)
-    client = EducationAPI("faesa", username, password)
-    client.access_token = authenticate(client, 3)
+    client.username, client.password = username, password
+    token_manager = TokenManager(client)
+    token_manager.start(attempts=3)
 
     my_courses = client.get_my_courses()
     actual_courses = [
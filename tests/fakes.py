@@ -0,0 +1,86 @@
+from requests.adapters import BaseAdapter
+from eadconnect.http.cache import build_response
+from eadconnect.services.notification_service import GradeMonitor
+from eadconnect.utils.history import GradeHistory
+
+
+class StatusAdapter(BaseAdapter):
+    """Answers every request with ``status_code`` without touching the network."""
+
+    def __init__(self, status_code):
+        super().__init__()
+        self.status_code = status_code
+        self.sent = 0
+
+    def send(self, request, **kwargs):
+        self.sent += 1
+        response = build_response(self.status_code, {}, b'{}', request.url)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    username = "aluno"
+
+    def __init__(self, grades):
+        self.grades = grades
+
+    def get_me(self):
+        return {'user': {'name': 'Aluno', 'email': 'aluno@example.test'}}
+
+    def get_my_courses(self):
+        return {'courses': [
+            {'id': 1, 'name': 'Cálculo I (2024)', 'status': 'isActual'},
+            {'id': 2, 'name': 'Física I (2024)', 'status': 'isActual'},
+        ]}
+
+    def get_grades(self, course_id):
+        return self.grades[course_id]
+
+
+class Outbox:
+    def __init__(self):
+        self.messages = []
+
+    def put(self, message, delete_after=None):
+        self.messages.append((message, delete_after))
+
+
+def grade(value):
+    return {'finalGrade': {'value': value}}
+
+
+def monitor_for(session, tmp_path, history=None):
+    monitor = GradeMonitor(
+        session,
+        api_id=1,
+        api_hash='0' * 32,
+        recipient='me',
+        session_name=str(tmp_path / 'telegram'),
+        history=history or GradeHistory(tmp_path / 'grades.sqlite3')
+    )
+    monitor.notifications = Outbox()
+    return monitor
+
+
+class FakeCourseClient:
+    """Serves one course whose topics are listed by `topics_of`."""
+
+    def __init__(self, topic_ids):
+        self.topic_ids = topic_ids
+
+    def get_contents(self, course_id):
+        return {'topics': [{'id': topic_id} for topic_id in self.topic_ids]}
+
+    def get_exercises(self, course_id, topic_id):
+        return {'id': topic_id, 'title': f"Tópico {topic_id}"}
+
+
+def topics_of(contents):
+    return [{'id': topic['id'], 'title': f"Tópico {topic['id']}"} for topic in contents['topics']]
+
+
+COURSE = {'id': 1, 'title': 'Cálculo I', 'course_name': 'calculo_i'}
@@ -0,0 +1,40 @@
+import asyncio
+from eadconnect.http.cache import build_response
+from eadconnect.services.academic_service import AcademicService
+from eadconnect.utils.history import GradeHistory
+from tests.fakes import (
+    FakeSession,
+    grade,
+    monitor_for
+)
+
+COURSES = [
+    {'id': 1, 'name': 'Cálculo I'},
+    {'id': 2, 'name': 'Física I'},
+]
+
+
+def test_failed_courses_are_left_out():
+    client = FakeSession({1: grade(8.5), 2: build_response(503, {}, b'', 'https://api.example.test')})
+
+    grades = AcademicService(client).get_grades_by_course_id(COURSES)
+
+    assert grades == {1: ('Cálculo I', 8.5)}
+
+
+def test_history_is_shared_with_grade_monitor(tmp_path):
+    client = FakeSession({1: grade(8.5), 2: {'finalGrade': None}})
+    service = AcademicService(client)
+    history = GradeHistory(tmp_path / 'grades.sqlite3')
+
+    changes = service.detect_grade_changes(
+        service.get_grades_by_course_id(COURSES),
+        history=history,
+        account='aluno'
+    )
+    assert {course_id: change['now'] for course_id, change in changes.items()} == {1: 8.5, 2: 'N/A'}
+
+    monitor = monitor_for(client, tmp_path, history)
+    asyncio.run(monitor._verificar_e_notificar())
+
+    assert monitor.notifications.messages == [("👍 Nenhuma alteração nas notas.", 30)]
@@ -0,0 +1,15 @@
+from eadconnect.account_pool import AccountPool
+from eadconnect.http.navigator import DEFAULT_POOL_MAXSIZE
+
+
+def test_accounts_share_an_adapter_built_like_the_browser_one(tmp_path):
+    with AccountPool(max_workers=2, pool_block=True, credentials_dir=tmp_path) as pool:
+        first = pool.add_account('a', 'faesa', 'user-a', 'secret')
+        second = pool.add_account('b', 'faesa', 'user-b', 'secret')
+
+    assert first.adapter is second.adapter is pool.adapter
+    assert first.ssl_context is pool.adapter.ssl_context is pool.ssl_context
+    assert pool.ssl_context.session_cache is not None
+    assert pool.adapter._pool_block is True
+    assert pool.adapter._pool_maxsize == DEFAULT_POOL_MAXSIZE
+    assert pool.adapter.max_retries.total == 0
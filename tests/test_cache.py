@@ -0,0 +1,43 @@
+import json
+import base64
+from eadconnect.http.cache import ResponseCache
+from eadconnect.http.navigator import Browser
+from tests.fakes import StatusAdapter
+
+URL = "https://api.example.test/content/academics-main/1/contents"
+
+
+def jwt(**claims):
+    def part(value):
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).rstrip(b'=').decode()
+    return f"Bearer {part({'alg': 'HS256'})}.{part(claims)}.signature"
+
+
+def key(token):
+    return ResponseCache.make_key('GET', URL, {'page': 1}, {'Authorization': token})
+
+
+def test_refreshed_token_keeps_the_key():
+    first = jwt(iss='grupoa', sub='aluno', exp=1000, iat=1)
+    refreshed = jwt(iss='grupoa', sub='aluno', exp=5000, iat=4000)
+
+    assert key(first) == key(refreshed)
+    assert key(first) != key(jwt(iss='grupoa', sub='outro', exp=1000))
+    assert key(first) != key(None)
+
+
+def test_opaque_tokens_are_their_own_identity():
+    assert key('token-a') != key('token-b')
+    assert key('token-a') == key('token-a')
+
+
+def test_browser_serves_the_cache_after_a_token_refresh(tmp_path):
+    adapter = StatusAdapter(200)
+    browser = Browser(adapter=adapter, cache=ResponseCache(tmp_path / 'cache.sqlite3'), rate_limiter=None)
+
+    for token in (jwt(sub='aluno', exp=1000), jwt(sub='aluno', exp=5000)):
+        response = browser.send_request('GET', URL, headers={'Authorization': token})
+        assert response.ok
+
+    assert adapter.sent == 1
+    assert response.from_cache
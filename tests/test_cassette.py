@@ -0,0 +1,36 @@
+import pytest
+from eadconnect.client import EducationAPI
+from eadconnect.http.cassette import (
+    RECORD,
+    Cassette,
+    CassetteMiss
+)
+from eadconnect.http.navigator import Browser
+from tests.fakes import StatusAdapter
+
+
+def record(path, *urls):
+    with Cassette(path, RECORD) as cassette:
+        browser = Browser(adapter=StatusAdapter(200), cassette=cassette, rate_limiter=None)
+        for url in urls:
+            browser.send_request('GET', url, params={'page': 1})
+
+
+def test_replay_miss_raises_with_the_request(tmp_path):
+    path = tmp_path / 'run.jsonl.gz'
+    record(path, 'https://api.example.test/recorded')
+    browser = Browser(cassette=Cassette(path), rate_limiter=None)
+
+    assert browser.send_request('GET', 'https://api.example.test/recorded', params={'page': 1}).ok
+    with pytest.raises(CassetteMiss, match=r'GET https://api.example.test/recorded\?page=2'):
+        browser.send_request('GET', 'https://api.example.test/recorded', params={'page': 2})
+    assert browser.cassette.misses == 1
+
+
+def test_endpoint_methods_surface_the_miss(tmp_path):
+    path = tmp_path / 'run.jsonl.gz'
+    record(path, 'https://api.example.test/recorded')
+    client = EducationAPI("faesa", cassette=Cassette(path), rate_limiter=None)
+
+    with pytest.raises(CassetteMiss, match='/grades/me/course/42'):
+        client.get_grades(42)
@@ -0,0 +1,125 @@
+import asyncio
+import inspect
+import threading
+from requests.adapters import BaseAdapter
+from eadconnect.api import EducationAPIRequests
+from eadconnect.client import EducationAPI
+from eadconnect.async_client import AsyncEducationAPI
+from eadconnect.http.cache import build_response
+from eadconnect.utils import auth
+from eadconnect.utils.auth import (
+    TokenManager,
+    TokenStore
+)
+
+BUILDERS = [
+    name.removesuffix('_request') for name in vars(EducationAPIRequests) if name.endswith('_request')
+]
+
+
+def test_both_clients_expose_every_endpoint():
+    for name in BUILDERS:
+        assert not inspect.iscoroutinefunction(getattr(EducationAPI, name)), name
+        assert inspect.iscoroutinefunction(getattr(AsyncEducationAPI, name)), name
+
+
+def calls(api):
+    return [
+        api.get_debts("123", page=2),
+        api.create_payment("123", {"value": 1}),
+        api.check_me("other"),
+        api.login()
+    ]
+
+
+def test_both_clients_send_the_same_requests():
+    sync_sent, async_sent = [], []
+
+    sync = EducationAPI("faesa", "user", "secret")
+    sync._call = sync_sent.append
+
+    async def call(request):
+        async_sent.append(request)
+
+    async def run():
+        client = AsyncEducationAPI("faesa", "user", "secret")
+        client._call = call
+        for api in (sync, client):
+            api.access_token = "token"
+            api.app_access_token = "app-token"
+
+        calls(sync)
+        await asyncio.gather(*calls(client))
+        await client.close()
+
+    asyncio.run(run())
+
+    assert sync_sent == async_sent
+    assert sync_sent[0]['params']['page'] == 2
+    assert sync_sent[0]['headers']['Authorization'] == "app-token"
+    assert sync_sent[2]['headers']['Authorization'] == "other"
+    assert sync_sent[3]['json']['password'] == "secret"
+
+
+class TokenAdapter(BaseAdapter):
+    """Answers 200 to the client's current token and 401 to any other.
+
+    The first request with ``stale_token`` refreshes the token from another
+    thread while it is in flight, before its 401 comes back.
+    """
+
+    def __init__(self, client, manager, stale_token):
+        super().__init__()
+        self.client = client
+        self.manager = manager
+        self.stale_token = stale_token
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        token = request.headers.get('Authorization')
+        self.sent.append(token)
+        if token == self.stale_token and self.sent.count(token) == 1:
+            refresher = threading.Thread(target=self.manager.refresh)
+            refresher.start()
+            refresher.join()
+        status_code = 200 if token == self.client.access_token else 401
+        response = build_response(status_code, {}, b'{}', request.url)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def managed_client(tmp_path, monkeypatch):
+    logins = []
+
+    def login(client):
+        logins.append(client)
+        return f"token-{len(logins)}"
+
+    monkeypatch.setattr(auth, 'login', login)
+    monkeypatch.setattr(auth, 'authenticate', lambda client, *args: "token-0")
+    client = EducationAPI("faesa", "user", "secret")
+    manager = TokenManager(client, store=TokenStore(tmp_path / "credentials.json"))
+    manager.start()
+    adapter = TokenAdapter(client, manager, "token-0")
+    client.mount("https://", adapter)
+    return client, adapter, logins
+
+
+def test_401_after_a_concurrent_refresh_retries_with_the_new_token(tmp_path, monkeypatch):
+    client, adapter, logins = managed_client(tmp_path, monkeypatch)
+
+    assert client.get_periods() == {}
+    assert adapter.sent == ["token-0", "token-1"]
+    assert len(logins) == 1
+
+
+def test_401_with_a_foreign_token_is_not_retried(tmp_path, monkeypatch):
+    client, adapter, logins = managed_client(tmp_path, monkeypatch)
+    adapter.stale_token = None
+
+    assert client.check_me("other").status_code == 401
+    assert adapter.sent == ["other"]
+    assert logins == []
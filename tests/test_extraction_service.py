@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from eadconnect.services.extraction_service import ExtractionPipeline
+from eadconnect.utils import file_manager
+from eadconnect.utils.manifest import (
+    ADDED,
+    CHANGED,
+    SKIPPED,
+    ExportManifest
+)
+from eadconnect.utils.pdf import PDFRenderPool
+from tests.fakes import (
+    COURSE,
+    FakeCourseClient,
+    topics_of
+)
+
+
+class RecordingPool:
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, data, output, logo_path=None):
+        self.jobs.append(data)
+        pdf_file = output / f"{data['title']}.pdf"
+        pdf_file.write_bytes(b'%PDF-1.4')
+        future = Future()
+        future.set_result(pdf_file)
+        return future
+
+
+def test_save_exercise_data_renders_in_the_pool_and_records_the_manifest(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_manager, 'json_path', tmp_path / 'json')
+    monkeypatch.setattr(file_manager, 'pdf_path', tmp_path / 'pdfs')
+    manifest = ExportManifest('calculo_i', directory=tmp_path)
+    pool = RecordingPool()
+    exercises = {'title': 'Tópico 7', 'content': []}
+
+    first = file_manager.save_exercise_data(exercises, 'calculo_i', 7, manifest, pool)
+    second = file_manager.save_exercise_data(exercises, 'calculo_i', 7, manifest, pool)
+
+    assert (first, second) == (ADDED, SKIPPED)
+    assert pool.jobs == [exercises]
+    assert (tmp_path / 'pdfs' / 'calculo_i' / 'Tópico 7.pdf').exists()
+
+
+def test_save_exercise_data_renders_again_when_the_pdf_is_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_manager, 'json_path', tmp_path / 'json')
+    monkeypatch.setattr(file_manager, 'pdf_path', tmp_path / 'pdfs')
+    manifest = ExportManifest('calculo_i', directory=tmp_path)
+    pool = RecordingPool()
+    exercises = {'title': 'Tópico 7', 'content': []}
+
+    file_manager.save_exercise_data(exercises, 'calculo_i', 7, manifest, pool)
+    (tmp_path / 'pdfs' / 'calculo_i' / 'Tópico 7.pdf').unlink()
+    status = file_manager.save_exercise_data(exercises, 'calculo_i', 7, manifest, pool)
+
+    assert status == CHANGED
+    assert pool.jobs == [exercises, exercises]
+    assert (tmp_path / 'pdfs' / 'calculo_i' / 'Tópico 7.pdf').exists()
+
+
+def test_pipeline_hands_its_render_pool_to_the_writer():
+    pools = []
+
+    def writer(course, topic, payload, manifest=None, render_pool=None):
+        pools.append(render_pool)
+
+    pipeline = ExtractionPipeline(
+        FakeCourseClient([1, 2]),
+        list_topics=topics_of,
+        transform=lambda course, topic, data: data,
+        writer=writer,
+        skip_unchanged=False,
+        render_processes=1
+    )
+    asyncio.run(pipeline.run([COURSE]))
+
+    assert len(pools) == 2
+    assert all(isinstance(pool, PDFRenderPool) for pool in pools)
+    assert pipeline.render_pool is None
+
+
+def test_pipeline_calls_writers_without_manifest_with_three_arguments():
+    written = []
+
+    def writer(course, topic, payload):
+        written.append(topic['id'])
+
+    pipeline = ExtractionPipeline(
+        FakeCourseClient([1, 2]),
+        list_topics=topics_of,
+        transform=lambda course, topic, data: data,
+        writer=writer
+    )
+    asyncio.run(pipeline.run([COURSE]))
+
+    assert sorted(written) == [1, 2]
+    assert pipeline.failures == []
+    assert pipeline.manifests == {}
+
+
+def test_topics_of_one_course_are_written_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def writer(course, topic, payload):
+        barrier.wait()
+
+    pipeline = ExtractionPipeline(
+        FakeCourseClient([1, 2]),
+        list_topics=topics_of,
+        transform=lambda course, topic, data: data,
+        writer=writer,
+        write_workers=2
+    )
+    asyncio.run(pipeline.run([COURSE]))
+
+    assert pipeline.failures == []
+    assert pipeline.stats['write'].processed == 2
+
+
+def test_writer_threads_keep_every_render_process_busy():
+    def writer(course, topic, payload, render_pool=None):
+        pass
+
+    def writer_without_pool(course, topic, payload):
+        pass
+
+    assert ExtractionPipeline(None, writer=writer, render_processes=3)._write_workers() == 4
+    assert ExtractionPipeline(None, writer=writer, render_processes=0)._write_workers() == 2
+    assert ExtractionPipeline(None, writer=writer_without_pool)._write_workers() == 2
+    assert ExtractionPipeline(None, writer=writer, write_workers=1)._write_workers() == 1
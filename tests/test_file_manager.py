@@ -0,0 +1,58 @@
+import zipfile
+import threading
+from eadconnect.utils.file_manager import ArchiveManager
+
+
+def test_replacing_a_member_keeps_the_others_metadata(tmp_path):
+    directory = tmp_path / 'calculo_i'
+    directory.mkdir()
+    unchanged = directory / '1.json'
+    replaced = directory / '2.json'
+    unchanged.write_text('{"questions": "%s"}' % ('abc ' * 2000))
+    replaced.write_text('{"questions": []}')
+
+    manager = ArchiveManager(directory)
+    with zipfile.ZipFile(manager.archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        archive.write(unchanged, '1.json')
+        archive.write(replaced, '2.json')
+    with zipfile.ZipFile(manager.archive_path) as archive:
+        before = archive.getinfo('1.json')
+
+    replaced.write_text('{"questions": [1]}')
+    manager.add(replaced)
+
+    with zipfile.ZipFile(manager.archive_path) as archive:
+        after = archive.getinfo('1.json')
+        assert archive.testzip() is None
+        assert archive.read('1.json') == unchanged.read_bytes()
+        assert archive.read('2.json') == b'{"questions": [1]}'
+    assert (after.CRC, after.file_size, after.date_time, after.compress_type, after.external_attr) == \
+        (before.CRC, before.file_size, before.date_time, before.compress_type, before.external_attr)
+
+
+def test_managers_of_the_same_directory_share_the_archive_lock(tmp_path):
+    directory = tmp_path / 'calculo_i'
+    directory.mkdir()
+    files = []
+    for index in range(8):
+        file_path = directory / f"{index}.json"
+        file_path.write_text('{"questions": "%s"}' % (str(index) * 5000))
+        files.append(file_path)
+
+    barrier = threading.Barrier(len(files))
+
+    def add(file_path):
+        manager = ArchiveManager(directory)
+        barrier.wait()
+        manager.add(file_path)
+
+    threads = [threading.Thread(target=add, args=(file_path,)) for file_path in files]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert ArchiveManager(directory)._lock is ArchiveManager(directory)._lock
+    with zipfile.ZipFile(ArchiveManager(directory).archive_path) as archive:
+        assert archive.testzip() is None
+        assert sorted(archive.namelist()) == sorted(file_path.name for file_path in files)
@@ -0,0 +1,13 @@
+import pytest
+from eadconnect.http.navigator import Browser
+
+pytest.importorskip('h2')
+
+
+def test_pool_block_caps_the_http2_connections():
+    blocking = Browser(http2=True, pool_maxsize=4, pool_block=True, cipherSuite='DEFAULT')
+    growing = Browser(http2=True, pool_maxsize=4, cipherSuite='DEFAULT')
+
+    assert blocking.adapter.limits.max_connections == 4
+    assert growing.adapter.limits.max_connections is None
+    assert growing.adapter.limits.max_keepalive_connections == 4
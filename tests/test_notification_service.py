@@ -0,0 +1,46 @@
+import asyncio
+from eadconnect.http.cache import build_response
+from tests.fakes import (
+    FakeSession,
+    grade,
+    monitor_for
+)
+
+
+def test_failed_grade_request_is_skipped(tmp_path):
+    session = FakeSession({1: grade(8.5), 2: grade(7.0)})
+    monitor = monitor_for(session, tmp_path)
+    asyncio.run(monitor._verificar_e_notificar())
+    monitor.notifications.messages.clear()
+
+    # A 503 from an open circuit and a 429 after the retries ran out.
+    session.grades = {
+        1: build_response(503, {}, b'', 'https://api.example.test/grades/1'),
+        2: build_response(429, {}, b'', 'https://api.example.test/grades/2'),
+    }
+    asyncio.run(monitor._verificar_e_notificar())
+
+    assert monitor.history.latest('aluno') == {1: ('Cálculo I', 8.5), 2: ('Física I', 7.0)}
+    assert [delete_after for _, delete_after in monitor.notifications.messages] == [30]
+
+    # Recovering with the same grades is not a change either.
+    session.grades = {1: grade(8.5), 2: grade(7.0)}
+    asyncio.run(monitor._verificar_e_notificar())
+
+    assert len(monitor.history.history('aluno', 1)) == len(monitor.history.history('aluno', 2)) == 1
+    assert all(delete_after == 30 for _, delete_after in monitor.notifications.messages)
+
+
+def test_only_the_failed_course_is_skipped(tmp_path):
+    session = FakeSession({
+        1: grade(9.0),
+        2: build_response(503, {}, b'', 'https://api.example.test/grades/2'),
+    })
+    monitor = monitor_for(session, tmp_path)
+
+    asyncio.run(monitor._verificar_e_notificar())
+
+    assert monitor.history.latest('aluno') == {1: ('Cálculo I', 9.0)}
+    (message, delete_after), = monitor.notifications.messages
+    assert delete_after is None
+    assert 'Cálculo I' in message and 'Física I' not in message
@@ -0,0 +1,71 @@
+import asyncio
+import logging
+from eadconnect.utils.pagination import (
+    aiter_pages,
+    extract_items,
+    iter_pages
+)
+
+ITEMS = list(range(45))
+CAP = 20
+
+
+def capped_server(envelope):
+    """Pages of at most ``CAP`` items, whatever ``perPage`` asks for."""
+    calls = []
+
+    def fetch(page, per_page):
+        calls.append(page)
+        size = min(per_page, CAP)
+        items = ITEMS[(page - 1) * size:page * size]
+        return {'notices': items, **envelope(page, size)}
+
+    return fetch, calls
+
+
+def test_total_items_outweighs_a_capped_page_size():
+    fetch, calls = capped_server(lambda page, size: {'total': len(ITEMS)})
+
+    assert list(iter_pages(fetch, 'notices', page_size=50)) == ITEMS
+    assert calls == [1, 2, 3]
+
+
+def test_total_pages_in_nested_metadata():
+    fetch, calls = capped_server(lambda page, size: {'meta': {'totalPages': 3, 'page': page}})
+
+    assert list(iter_pages(fetch, 'notices', page_size=50, prefetch=True)) == ITEMS
+    assert calls == [1, 2, 3]
+
+
+def test_has_next_flag_ends_the_iteration():
+    fetch, calls = capped_server(lambda page, size: {'pagination': {'hasNext': page < 2}})
+
+    assert list(iter_pages(fetch, 'notices', page_size=CAP)) == ITEMS[:40]
+    assert calls == [1, 2]
+
+
+def test_short_page_ends_the_iteration_without_metadata():
+    fetch, calls = capped_server(lambda page, size: {})
+
+    assert list(iter_pages(fetch, 'notices', page_size=CAP)) == ITEMS
+    assert calls == [1, 2, 3]
+
+
+def test_async_pages_follow_the_metadata():
+    fetch, calls = capped_server(lambda page, size: {'total': len(ITEMS)})
+
+    async def afetch(page, per_page):
+        return fetch(page, per_page)
+
+    async def collect():
+        return [item async for item in aiter_pages(afetch, 'notices', page_size=50, prefetch=True)]
+
+    assert asyncio.run(collect()) == ITEMS
+    assert calls == [1, 2, 3]
+
+
+def test_missing_items_key_is_reported(caplog):
+    with caplog.at_level(logging.WARNING):
+        assert extract_items({'data': [1, 2]}, 'notices') == []
+
+    assert "'notices'" in caplog.text
@@ -0,0 +1,23 @@
+from eadconnect.http.navigator import Browser
+from eadconnect.http.async_navigator import AsyncBrowser
+from eadconnect.http.ratelimit import RateLimiter
+from tests.fakes import StatusAdapter
+
+URL = "https://api.example.test/v1/plataforma/grades/me/course/1"
+
+
+def test_clients_are_not_rate_limited_by_default():
+    assert Browser().rate_limiter is None
+    assert AsyncBrowser().rate_limiter is None
+
+
+def test_a_limiter_is_shared_only_by_the_clients_given_it():
+    limiter = RateLimiter(rate=0.001, burst=10)
+    first = Browser(adapter=StatusAdapter(200), rate_limiter=limiter)
+    second = Browser(adapter=StatusAdapter(200), rate_limiter=limiter)
+    other = Browser(adapter=StatusAdapter(200))
+
+    for browser in (first, second, other):
+        browser.send_request('GET', URL)
+
+    assert round(limiter.bucket_for(URL).tokens) == 8
@@ -0,0 +1,207 @@
+import asyncio
+import httpx
+import httpcore
+import urllib3
+from httpcore._backends.auto import AutoBackend
+from requests.adapters import BaseAdapter
+from requests.exceptions import ChunkedEncodingError
+from eadconnect.http.cache import build_response
+from eadconnect.http.navigator import Browser
+from eadconnect.http.async_navigator import AsyncBrowser
+from eadconnect.http.retry import (
+    OPEN,
+    CircuitBreaker,
+    RetryManager,
+    RetryPolicy
+)
+from tests.fakes import StatusAdapter
+
+URL = "https://api.example.test/content/academics-main/1/contents"
+
+
+def tripping_retry():
+    """No retries and a circuit that opens on the first failure."""
+    return RetryManager(
+        default=RetryPolicy(total=0),
+        budget=None,
+        breaker=CircuitBreaker(failure_threshold=1)
+    )
+
+
+def probing_retry():
+    """No retries; the circuit opens on one failure and probes right away."""
+    return RetryManager(
+        default=RetryPolicy(total=0),
+        budget=None,
+        breaker=CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    )
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Plays ``script`` in order: a status code to answer, or an exception to raise."""
+
+    def __init__(self, script):
+        super().__init__()
+        self.script = list(script)
+
+    def send(self, request, **kwargs):
+        step = self.script.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        response = build_response(step, {}, b'{}', request.url)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def retrying(total):
+    return RetryManager(default=RetryPolicy(total=total, backoff_factor=0), budget=None, breaker=None)
+
+
+def async_browser(status_code, **kwargs):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(status_code, json={})
+
+    browser = AsyncBrowser(rate_limiter=None, **kwargs)
+    browser.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return browser, calls
+
+
+def test_browser_open_circuit_returns_local_503_to_hooks():
+    events = []
+    adapter = StatusAdapter(503)
+    retry = tripping_retry()
+    browser = Browser(adapter=adapter, retry=retry, rate_limiter=None, instrumentation=[events.append])
+
+    first = browser.send_request('GET', URL)
+    second = browser.send_request('GET', URL)
+
+    assert retry.breaker.state(retry.endpoint(URL)) == OPEN
+    assert adapter.sent == 1
+    assert first.status_code == second.status_code == 503
+    assert second.from_circuit_breaker
+    assert [event.status_code for event in events] == [503, 503]
+    assert events[1].ttfb is None
+    assert events[1].error is None
+
+
+def test_async_browser_open_circuit_returns_local_503_to_hooks():
+    events = []
+    retry = tripping_retry()
+    browser, calls = async_browser(503, retry=retry, instrumentation=[events.append])
+
+    async def run():
+        async with browser:
+            return [await browser.send_request('GET', URL) for _ in range(2)]
+
+    first, second = asyncio.run(run())
+
+    assert retry.breaker.state(retry.endpoint(URL)) == OPEN
+    assert len(calls) == 1
+    assert first.status_code == second.status_code == 503
+    assert second.from_circuit_breaker
+    assert [event.status_code for event in events] == [503, 503]
+    assert [event.ttfb for event in events] == [None, None]
+    assert events[1].error is None
+
+
+def test_both_transports_count_retries_alike():
+    sync_events, async_events = [], []
+    adapter = StatusAdapter(503)
+    browser = Browser(adapter=adapter, retry=retrying(2), rate_limiter=None, instrumentation=[sync_events.append])
+    response = browser.send_request('GET', URL)
+
+    async_client, calls = async_browser(503, retry=retrying(2), instrumentation=[async_events.append])
+
+    async def run():
+        async with async_client:
+            return await async_client.send_request('GET', URL)
+
+    async_response = asyncio.run(run())
+
+    assert adapter.sent == len(calls) == 3
+    assert response.retry_count == async_response.retry_count == 2
+    assert sync_events[0].retries == async_events[0].retries == 2
+
+
+def test_post_is_not_retried():
+    adapter = StatusAdapter(503)
+    browser = Browser(adapter=adapter, retry=retrying(2), rate_limiter=None)
+
+    response = browser.send_request('POST', URL, json={})
+
+    assert adapter.sent == 1
+    assert response.retry_count == 0
+
+
+def test_probe_ended_by_an_unexpected_error_does_not_stick_the_circuit():
+    adapter = ScriptedAdapter([500, ChunkedEncodingError("truncated"), 200])
+    browser = Browser(adapter=adapter, retry=probing_retry(), rate_limiter=None)
+
+    responses = [browser.send_request('GET', URL) for _ in range(3)]
+
+    assert responses[0].status_code == 500
+    assert responses[1] is None
+    assert responses[2].status_code == 200
+    assert not getattr(responses[2], 'from_circuit_breaker', False)
+
+
+def test_async_probe_ended_by_an_unexpected_error_does_not_stick_the_circuit():
+    script = [500, 'decoding', 200]
+
+    def handler(request):
+        step = script.pop(0)
+        if step == 'decoding':
+            raise httpx.DecodingError("bad gzip", request=request)
+        return httpx.Response(step, json={})
+
+    browser = AsyncBrowser(retry=probing_retry())
+    browser.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run():
+        async with browser:
+            return [await browser.send_request('GET', URL) for _ in range(3)]
+
+    responses = asyncio.run(run())
+
+    assert responses[0].status_code == 500
+    assert responses[1] is None
+    assert responses[2].status_code == 200
+    assert not getattr(responses[2], 'from_circuit_breaker', False)
+
+
+def test_connection_errors_are_only_retried_by_the_retry_policy(monkeypatch):
+    attempts = []
+
+    def refuse(address, *args, **kwargs):
+        attempts.append(address)
+        raise ConnectionRefusedError(address)
+
+    monkeypatch.setattr(urllib3.util.connection, 'create_connection', refuse)
+    browser = Browser(retry=retrying(2), rate_limiter=None)
+
+    assert browser.send_request('GET', URL) is None
+    assert len(attempts) == 3
+
+
+def test_async_connection_errors_are_only_retried_by_the_retry_policy(monkeypatch):
+    attempts = []
+
+    async def refuse(self, host, port, *args, **kwargs):
+        attempts.append((host, port))
+        raise httpcore.ConnectError(f"refused: {host}")
+
+    monkeypatch.setattr(AutoBackend, 'connect_tcp', refuse)
+    browser = AsyncBrowser(retry=retrying(2))
+
+    async def run():
+        async with browser:
+            return await browser.send_request('GET', URL)
+
+    assert asyncio.run(run()) is None
+    assert len(attempts) == 3
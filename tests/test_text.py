@@ -0,0 +1,17 @@
+from eadconnect.utils.text import html_to_text
+
+
+def test_cdata_sections_are_kept_as_text():
+    assert html_to_text('<p><![CDATA[x < y]]></p>') == 'x < y'
+    assert html_to_text('<p>fim</p><![CDATA[oi]]>') == 'fimoi'
+
+
+def test_bare_ampersands_are_left_alone():
+    assert html_to_text('<p>R&D, a & b</p>') == 'R&D, a & b'
+    assert html_to_text('&amp') == '&amp'
+    assert html_to_text('<p>&copy2024</p>') == '&copy2024'
+    assert html_to_text('<b>&foo;</b>') == '&foo'
+
+
+def test_character_references_are_resolved():
+    assert html_to_text('<p>1 &lt; 2&nbsp;&amp; &#65;&#x42; x&#128;</p>') == '1 < 2 & AB x€'
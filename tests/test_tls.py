@@ -0,0 +1,34 @@
+import ssl
+from eadconnect.http.navigator import (
+    SessionTrackingSSLObject,
+    create_ssl_context
+)
+
+CIPHERS = 'DEFAULT'
+
+
+def lookups(context):
+    hostnames = []
+    context.session_cache.get = lambda hostname: hostnames.append(hostname)
+    return hostnames
+
+
+def test_wrap_bio_applies_the_server_hostname_override():
+    context = create_ssl_context(CIPHERS, server_hostname='api.example.test')
+    hostnames = lookups(context)
+
+    tls = context.wrap_bio(ssl.MemoryBIO(), ssl.MemoryBIO(), server_hostname=b'localhost')
+
+    assert isinstance(tls, SessionTrackingSSLObject)
+    assert tls.server_hostname == 'api.example.test'
+    assert hostnames == ['api.example.test']
+
+
+def test_wrap_bio_looks_sessions_up_by_the_reported_hostname():
+    # httpcore passes the hostname as bytes, the SSLObject reports it as str.
+    context = create_ssl_context(CIPHERS)
+    hostnames = lookups(context)
+
+    tls = context.wrap_bio(ssl.MemoryBIO(), ssl.MemoryBIO(), server_hostname=b'localhost')
+
+    assert hostnames == [tls.server_hostname] == ['localhost']